@@ -120,6 +120,8 @@ class AgentConfigManager:
         self.current_config_file = self.config_dir / "current_config.json"
         self.configs: Dict[str, AgentConfig] = {}
         self.current_config_name: Optional[str] = None
+        self._version = 0  # 配置数据每次变更时递增
+        self._prompt_configs_cache = None  # (版本号, 提示词配置字典)
         self.load_all_configs()
     
     def load_all_configs(self):
@@ -135,6 +137,7 @@ class AgentConfigManager:
                     data = json.load(f)
                     config = self._dict_to_config(data)
                     self.configs[config.config_name] = config
+                    self._version += 1
             except Exception as e:
                 print(f"加载配置文件 {config_file} 失败: {e}")
 
@@ -603,6 +606,9 @@ class AgentConfigManager:
         if config_name not in self.configs:
             raise ValueError(f"配置 '{config_name}' 不存在")
         
+        # 所有修改路径都会经过保存，在此使提示词配置缓存失效
+        self._version += 1
+
         config = self.configs[config_name]
         from datetime import datetime
         config.updated_at = datetime.now().isoformat()
@@ -716,6 +722,7 @@ class AgentConfigManager:
 
         # 从内存中删除
         del self.configs[config_name]
+        self._version += 1
 
         # 如果删除的是当前配置，切换到其他配置
         if self.current_config_name == config_name:
@@ -726,6 +733,10 @@ class AgentConfigManager:
             # 保存新的当前配置名称
             self.save_current_config_name()
     
+    def get_version(self) -> int:
+        """获取配置数据版本号，配置新建、修改或删除后递增"""
+        return self._version
+
     def get_config_list(self) -> List[str]:
         """获取所有配置名称列表"""
         return list(self.configs.keys())
@@ -746,11 +757,15 @@ class AgentConfigManager:
         return AgentConfig(**data)
 
     def get_all_prompt_configs(self) -> Dict[str, AgentPromptConfig]:
-        """获取所有提示词配置"""
+        """获取所有提示词配置（按数据版本缓存）"""
+        if self._prompt_configs_cache and self._prompt_configs_cache[0] == self._version:
+            return self._prompt_configs_cache[1]
+
         prompt_configs = {}
         for config_name, config in self.configs.items():
             if config.prompt_config:
                 prompt_configs[config.prompt_config.name] = config.prompt_config
+        self._prompt_configs_cache = (self._version, prompt_configs)
         return prompt_configs
 
     def create_prompt_config(self, prompt_config: AgentPromptConfig) -> str:
@@ -4,9 +4,10 @@
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional
 import os
-import json
 from pathlib import Path
 
+from ..utils.json_io import atomic_write_bytes, clear_json_cache, config_json_dumps, json_loads
+
 
 @dataclass
 class KeywordConfig:
@@ -138,8 +139,8 @@ class FilterConfigManager:
         # 然后尝试从文件加载保存的配置
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    saved_configs = json.load(f)
+                # 一次读取全部字节再解析，避免文本流的逐块解码
+                saved_configs = json_loads(self.config_file.read_bytes())
 
                 # 更新AI配置
                 if "ai" in saved_configs:
@@ -237,9 +238,10 @@ class FilterConfigManager:
             for key, config in self.configs.items():
                 config_data[key] = asdict(config)
 
-            # 保存到文件
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            # 与筛选配置对话框使用相同的格式，先写临时文件再替换
+            atomic_write_bytes(self.config_file, config_json_dumps(config_data))
+            # 文件修改时间精度不足时缓存无法察觉变化，主动清除该文件的解析缓存
+            clear_json_cache(self.config_file)
 
             print(f"✅ 筛选配置已保存: {self.config_file}")
         except Exception as e:
@@ -257,20 +259,25 @@ class FilterConfigManager:
         """获取筛选链配置"""
         return self.configs["chain"]
     
-    def update_config(self, config_type: str, **kwargs):
-        """更新配置参数"""
+    def update_config(self, config_type: str, **kwargs) -> bool:
+        """更新配置参数，返回配置是否发生变化"""
         if config_type not in self.configs:
             raise ValueError(f"Unknown config type: {config_type}")
 
         config = self.configs[config_type]
+        changed = False
         for key, value in kwargs.items():
             if hasattr(config, key):
-                setattr(config, key, value)
+                if getattr(config, key) != value:
+                    setattr(config, key, value)
+                    changed = True
             else:
                 print(f"Warning: Unknown config key '{key}' for {config_type}")
 
-        # 自动保存配置
-        self.save_configs()
+        # 有变化时才自动保存配置
+        if changed:
+            self.save_configs()
+        return changed
 
     def reload_configs(self):
         """重新加载配置"""
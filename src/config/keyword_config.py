@@ -14,6 +14,8 @@ class KeywordConfigManager:
         self.config_file = Path(config_file)
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         self._keywords_data = {}
+        self._version = 0  # 关键词数据每次变更时递增
+        self._stats_cache = None  # (版本号, 统计信息)
         self.load_keywords()
     
     def load_keywords(self):
@@ -22,6 +24,7 @@ class KeywordConfigManager:
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     self._keywords_data = json.load(f)
+                self._version += 1
                 print(f"已加载自定义关键词配置: {len(self._keywords_data)} 个分类")
             except Exception as e:
                 print(f"加载关键词配置失败: {e}")
@@ -51,6 +54,8 @@ class KeywordConfigManager:
     
     def save_keywords(self):
         """保存关键词配置"""
+        # 所有修改路径都会经过保存，在此使统计缓存失效
+        self._version += 1
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self._keywords_data, f, ensure_ascii=False, indent=2)
@@ -90,7 +95,10 @@ class KeywordConfigManager:
         return all_keywords
     
     def get_statistics(self) -> Dict[str, int]:
-        """获取关键词统计信息"""
+        """获取关键词统计信息（按数据版本缓存）"""
+        if self._stats_cache and self._stats_cache[0] == self._version:
+            return self._stats_cache[1]
+
         total_categories = len(self._keywords_data)
         total_keywords = sum(len(keywords) for keywords in self._keywords_data.values())
         
@@ -98,11 +106,13 @@ class KeywordConfigManager:
         for category, keywords in self._keywords_data.items():
             category_stats[category] = len(keywords)
         
-        return {
+        stats = {
             'total_categories': total_categories,
             'total_keywords': total_keywords,
             'category_stats': category_stats
         }
+        self._stats_cache = (self._version, stats)
+        return stats
     
     def reset_to_default(self):
         """重置为默认关键词"""
@@ -3,6 +3,7 @@
 """
 import time
 import logging
+import threading
 from datetime import datetime
 from typing import List, Optional, Callable, Tuple, Dict, Any
 from ..models.news import NewsArticle
@@ -255,8 +256,9 @@ class FilterChain:
             return combined_results
     
     def process_with_callback(self, articles: List[NewsArticle], 
-                            callback: FilterProgressCallback, test_mode: bool = False) -> FilterChainResult:
-        """带进度回调的筛选流程"""
+                            callback: FilterProgressCallback, test_mode: bool = False,
+                            cancel_event: Optional[threading.Event] = None) -> FilterChainResult:
+        """带进度回调的筛选流程，cancel_event置位后逐篇筛选循环尽快停止"""
         callback.on_start(len(articles))
         
         try:
@@ -270,15 +272,16 @@ class FilterChain:
             keyword_results = []
             if self.config.enable_keyword_filter:
                 keyword_results = self._execute_keyword_filter_with_callback(
-                    articles, result, callback
+                    articles, result, callback, cancel_event
                 )
                 callback.on_keyword_complete(len(keyword_results))
             
-            # AI筛选
+            # AI筛选（已取消时跳过）
             ai_results = []
-            if self.config.enable_ai_filter and keyword_results:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            if self.config.enable_ai_filter and keyword_results and not cancelled:
                 ai_results = self._execute_ai_filter_with_callback(
-                    keyword_results, result, callback, test_mode
+                    keyword_results, result, callback, test_mode, cancel_event
                 )
                 callback.on_ai_complete(len(ai_results))
             
@@ -378,12 +381,15 @@ class FilterChain:
     
     def _execute_keyword_filter_with_callback(self, articles: List[NewsArticle],
                                             result: FilterChainResult,
-                                            callback: FilterProgressCallback) -> List[KeywordFilterResult]:
+                                            callback: FilterProgressCallback,
+                                            cancel_event: Optional[threading.Event] = None) -> List[KeywordFilterResult]:
         """带回调的关键词筛选"""
         keyword_results = []
         batch_size = self.config.batch_size
         
         for i in range(0, len(articles), batch_size):
+            if cancel_event is not None and cancel_event.is_set():
+                break
             batch = articles[i:i + batch_size]
             batch_results = []
             
@@ -408,7 +414,8 @@ class FilterChain:
     
     def _execute_ai_filter_with_callback(self, keyword_results: List[KeywordFilterResult],
                                        result: FilterChainResult,
-                                       callback: FilterProgressCallback, test_mode: bool = False) -> List[AIFilterResult]:
+                                       callback: FilterProgressCallback, test_mode: bool = False,
+                                       cancel_event: Optional[threading.Event] = None) -> List[AIFilterResult]:
         """带回调的AI筛选"""
         articles = [kr.article for kr in keyword_results]
         
@@ -440,11 +447,16 @@ class FilterChain:
                 batch_results = []
 
                 for article in batch:
+                    # 每篇文章都要调用AI接口，取消后不再发起新的请求
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
                     single_result = self.ai_filter.filter_single(article)
                     if single_result:
                         batch_results.append(single_result)
 
                 all_results.extend(batch_results)
+                if cancel_event is not None and cancel_event.is_set():
+                    break
                 callback.on_ai_progress(min(i + batch_size, len(articles)), len(articles))
 
         # 按评分排序并取前N条
@@ -173,7 +173,7 @@ class BatchFilterDialog:
 
         def update_dedup_label(*args):
             dedup_label.config(text=f"{self.dedup_threshold_var.get():.2f}")
-        self.dedup_threshold_var.trace('w', update_dedup_label)
+        self.dedup_threshold_var.trace_add('write', update_dedup_label)
 
         # 去重时间窗口
         ttk.Label(group, text="去重时间窗口:").grid(row=4, column=0, sticky=tk.W, pady=(5, 0))
@@ -195,7 +195,7 @@ class BatchFilterDialog:
 
         def update_ai_semantic_label(*args):
             ai_semantic_label.config(text=f"{self.ai_semantic_threshold_var.get():.2f}")
-        self.ai_semantic_threshold_var.trace('w', update_ai_semantic_label)
+        self.ai_semantic_threshold_var.trace_add('write', update_ai_semantic_label)
 
         # AI语义时间窗口
         ttk.Label(group, text="AI语义时间窗口:").grid(row=8, column=0, sticky=tk.W, pady=(5, 0))
@@ -1,7 +1,11 @@
 """
 批量筛选进度对话框
 """
+import functools
+import threading
 import tkinter as tk
+from collections import deque
+from datetime import datetime
 from tkinter import ttk
 from typing import Optional
 
@@ -9,6 +13,16 @@ from ..services.batch_filter_service import BatchFilterProgressCallback
 from ..filters.base import BatchFilterResult
 
 
+def _in_ui_thread(method):
+    """装饰器：批量筛选回调在后台线程中触发，此时把调用转交给Tk主线程执行"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if threading.current_thread() is threading.main_thread():
+            return method(self, *args, **kwargs)
+        self._post(method, args, kwargs)
+    return wrapper
+
+
 class BatchFilterProgressDialog(BatchFilterProgressCallback):
     """批量筛选进度对话框"""
     
@@ -38,6 +52,12 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         
         # 日志列表
         self.log_messages = []
+
+        # 后台线程转交的回调，由主线程按顺序执行；已排队执行时不再重复排队
+        self._pending_calls = deque()
+        self._flush_scheduled = False
+        # 日志框滚动到底部推迟到主线程空闲时进行，一批回调只滚动一次
+        self._scroll_scheduled = False
     
     def show(self):
         """显示进度对话框"""
@@ -127,26 +147,58 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.close_button = ttk.Button(button_frame, text="后台运行", command=self.minimize_dialog, state=tk.NORMAL)
         self.close_button.pack(side=tk.RIGHT)
     
+    def _post(self, method, args, kwargs):
+        """记录一次回调，并在主线程空闲时统一执行（可在任意线程调用）"""
+        self._pending_calls.append((method, args, kwargs))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.parent.after(0, self._flush_pending_calls)
+
+    def _flush_pending_calls(self):
+        """在主线程中执行所有已转交的回调"""
+        # 先清除标记再取回调，执行期间新转交的回调会排队下一次执行
+        self._flush_scheduled = False
+        while self._pending_calls:
+            method, args, kwargs = self._pending_calls.popleft()
+            try:
+                method(self, *args, **kwargs)
+            except tk.TclError:
+                # 对话框可能已经被销毁
+                pass
+
     def add_log_message(self, message: str, level: str = "INFO"):
         """添加日志消息"""
+        self.add_log_messages([message], level)
+
+    def add_log_messages(self, messages, level: str = "INFO"):
+        """添加多条日志消息，一次插入日志框"""
         if self.is_closed or not self.log_text:
             return
             
         try:
-            self.log_text.config(state=tk.NORMAL)
-            
             # 添加时间戳和级别
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            formatted_message = f"[{timestamp}] {level}: {message}\n"
-            
-            self.log_text.insert(tk.END, formatted_message)
-            self.log_text.see(tk.END)  # 滚动到底部
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            formatted = "".join(f"[{timestamp}] {level}: {message}\n" for message in messages)
+
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, formatted)
             self.log_text.config(state=tk.DISABLED)
+
+            if not self._scroll_scheduled:
+                self._scroll_scheduled = True
+                self.log_text.after_idle(self._scroll_log_to_end)
             
-            # 更新界面
-            self.dialog.update_idletasks()
-            
+        except tk.TclError:
+            # 对话框可能已经被销毁
+            pass
+
+    def _scroll_log_to_end(self):
+        """把日志框滚动到底部"""
+        self._scroll_scheduled = False
+        if self.is_closed or not self.log_text:
+            return
+        try:
+            self.log_text.see(tk.END)
         except tk.TclError:
             # 对话框可能已经被销毁
             pass
@@ -166,14 +218,12 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
             stats_text = f"已获取文章: {self.total_articles_fetched} 篇 | 已筛选文章: {self.total_articles_selected} 篇"
             self.stats_var.set(stats_text)
             
-            # 更新界面
-            self.dialog.update_idletasks()
-            
         except tk.TclError:
             # 对话框可能已经被销毁
             pass
     
     # 实现BatchFilterProgressCallback接口
+    @_in_ui_thread
     def on_batch_start(self, total_subscriptions: int):
         """批量筛选开始"""
         self.total_subscriptions = total_subscriptions
@@ -182,6 +232,7 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.add_log_message(f"开始批量筛选，共 {total_subscriptions} 个订阅源")
         self.update_progress()
     
+    @_in_ui_thread
     def on_subscription_start(self, subscription, current: int, total: int):
         """开始处理订阅源"""
         self.current_subscription = current
@@ -191,18 +242,21 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.add_log_message(f"[{current}/{total}] 开始处理订阅源: {subscription.title}")
         self.update_progress()
 
+    @_in_ui_thread
     def on_subscription_fetch_complete(self, subscription, articles_count: int):
         """订阅源文章获取完成"""
         self.total_articles_fetched += articles_count
         self.add_log_message(f"获取到 {articles_count} 篇文章")
         self.update_progress()
 
+    @_in_ui_thread
     def on_subscription_filter_complete(self, subscription, selected_count: int):
         """订阅源筛选完成"""
         self.total_articles_selected += selected_count
         self.add_log_message(f"筛选完成，选中 {selected_count} 篇文章")
         self.update_progress()
 
+    @_in_ui_thread
     def on_global_deduplication_start(self, total_articles: int):
         """全局去重开始"""
         self.status_var.set("开始全局去重处理...")
@@ -212,6 +266,7 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.progress_var.set(50)
         self.progress_label.config(text="50% (全局去重中)")
 
+    @_in_ui_thread
     def on_global_deduplication_complete(self, original_count: int, deduplicated_count: int, removed_count: int):
         """全局去重完成"""
         self.add_log_message(f"去重完成: 原始{original_count}篇 → 去重后{deduplicated_count}篇 (去除{removed_count}篇重复)")
@@ -219,12 +274,14 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.progress_var.set(75)
         self.progress_label.config(text="75% (去重完成)")
 
+    @_in_ui_thread
     def on_global_filtering_start(self, article_count: int):
         """全局筛选开始"""
         self.status_var.set("开始全局筛选...")
         self.current_sub_var.set(f"正在筛选 {article_count} 篇文章")
         self.add_log_message(f"开始全局筛选，共 {article_count} 篇文章")
 
+    @_in_ui_thread
     def on_global_filtering_complete(self, selected_count: int):
         """全局筛选完成"""
         self.add_log_message(f"全局筛选完成，选中 {selected_count} 篇文章")
@@ -232,12 +289,14 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.progress_var.set(90)
         self.progress_label.config(text="90% (筛选完成)")
 
+    @_in_ui_thread
     def on_result_distribution_start(self):
         """结果分组开始"""
         self.status_var.set("正在按来源分组结果...")
         self.current_sub_var.set("分组处理中")
         self.add_log_message("开始按来源分组结果")
 
+    @_in_ui_thread
     def on_result_distribution_complete(self):
         """结果分组完成"""
         self.add_log_message("结果分组完成")
@@ -245,18 +304,22 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         self.progress_var.set(95)
         self.progress_label.config(text="95% (分组完成)")
 
+    @_in_ui_thread
     def on_deduplication_start(self, total_articles: int):
         """去重开始（用于单独的去重进度）"""
         self.add_log_message(f"开始去重处理，共 {total_articles} 篇文章")
 
+    @_in_ui_thread
     def on_deduplication_complete(self, original_count: int, deduplicated_count: int, removed_count: int):
         """去重完成（用于单独的去重进度）"""
         self.add_log_message(f"去重完成: 原始{original_count}篇 → 去重后{deduplicated_count}篇 (去除{removed_count}篇重复)")
 
+    @_in_ui_thread
     def on_subscription_error(self, subscription, error: str):
         """订阅源处理错误"""
         self.add_log_message(f"处理失败: {error}", "ERROR")
     
+    @_in_ui_thread
     def on_batch_complete(self, result: BatchFilterResult):
         """批量筛选完成"""
         self.status_var.set("批量筛选完成！")
@@ -267,11 +330,13 @@ class BatchFilterProgressDialog(BatchFilterProgressCallback):
         # 更新按钮
         self.close_button.config(text="关闭", command=self.close)
         
-        self.add_log_message("批量筛选完成！")
-        self.add_log_message(f"处理了 {result.processed_subscriptions}/{result.total_subscriptions} 个订阅源")
-        self.add_log_message(f"获取了 {result.total_articles_fetched} 篇文章")
-        self.add_log_message(f"筛选出 {result.total_articles_selected} 篇文章")
-        self.add_log_message(f"总耗时: {result.total_processing_time:.2f} 秒")
+        self.add_log_messages([
+            "批量筛选完成！",
+            f"处理了 {result.processed_subscriptions}/{result.total_subscriptions} 个订阅源",
+            f"获取了 {result.total_articles_fetched} 篇文章",
+            f"筛选出 {result.total_articles_selected} 篇文章",
+            f"总耗时: {result.total_processing_time:.2f} 秒",
+        ])
     
     def on_close_attempt(self):
         """用户尝试关闭对话框"""
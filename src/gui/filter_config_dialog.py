@@ -1,52 +1,262 @@
 """
 筛选配置对话框
 """
+import logging
+import os
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, Any, Optional
+from tkinter import ttk, messagebox, filedialog
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 from ..services.filter_service import get_filter_service
-from ..config.agent_config import agent_config_manager, AgentConfig, AgentAPIConfig, AgentPromptConfig
+from ..config.keyword_config import keyword_config_manager
+from ..utils.json_io import (
+    atomic_write_bytes, clear_json_cache, config_json_dumps, load_json_cached, store_json_cache
+)
+from .keyword_editor_dialog import KeywordEditorDialog
+
+if TYPE_CHECKING:
+    from ..config.agent_config import AgentConfig
+
+logger = logging.getLogger(__name__)
+
+# 对话框读写的筛选配置文件（相对于程序工作目录）
+_CONFIG_FILE = "config/filter_config.json"
+
+
+def clear_config_cache():
+    """清空筛选配置文件的解析缓存"""
+    clear_json_cache(_CONFIG_FILE)
 
 
 class FilterConfigDialog:
     """筛选配置对话框"""
+
+    # 对话框初始尺寸
+    WINDOW_WIDTH = 850
+    WINDOW_HEIGHT = 700
+
+    # 下拉框选项：服务提供商、各提供商的候选模型、结果排序方式
+    PROVIDERS = ("openai", "siliconflow", "volcengine", "moonshot", "custom")
+    MODEL_LISTS = {
+        "openai": ("gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4o"),
+        "siliconflow": ("Qwen/Qwen2.5-72B-Instruct", "Qwen/Qwen2.5-32B-Instruct",
+                        "meta-llama/Meta-Llama-3.1-70B-Instruct", "deepseek-ai/DeepSeek-V2.5"),
+        "volcengine": ("ep-20241219105006-xxxxx", "自定义Endpoint"),
+        "moonshot": ("moonshot-v1-8k", "moonshot-v1-32k", "moonshot-v1-128k"),
+        "custom": ("自定义模型",)
+    }
+    DEFAULT_MODELS = ("gpt-3.5-turbo",)
+    SORT_MODES = ("final_score", "relevance", "timestamp")
+
+    # 提示词预览的换行宽度（像素）
+    PREVIEW_WRAP_LENGTH = 560
+
+    # 滑块数值标签的最短刷新间隔（毫秒）及显示格式
+    LABEL_UPDATE_INTERVAL = 30
+    _format_value = staticmethod("{:.2f}".format)
+
+    # 下拉框选择停止变化多久（毫秒）后才执行刷新
+    SELECTION_DEBOUNCE_DELAY = 150
+
+    # 复用的对话框实例：关闭时只隐藏窗口，再次打开时重新加载配置
+    _instance: Optional["FilterConfigDialog"] = None
+
+    # 屏幕尺寸在会话内不变，首次打开时查询后缓存
+    _screen_size: Optional[Tuple[int, int]] = None
+
+    # 配置文件字段与界面变量的对应关系：分区 -> ((变量名, 配置键, 默认值, 类型), ...)
+    _SCHEMA = {
+        "keyword": (
+            ('keyword_threshold', 'threshold', 0.65, 'double'),
+            ('max_results', 'max_results', 150, 'int'),
+            ('min_matches', 'min_matches', 2, 'int'),
+            ('case_sensitive', 'case_sensitive', False, 'bool'),
+            ('fuzzy_match', 'fuzzy_match', True, 'bool'),
+            ('word_boundary', 'word_boundary', True, 'bool'),
+        ),
+        "ai": (
+            ('model_name', 'model_name', 'gpt-3.5-turbo', 'str'),
+            ('api_key', 'api_key', '', 'str'),
+            ('base_url', 'base_url', '', 'str'),
+            ('max_requests', 'max_requests', 50, 'int'),
+            ('min_score_threshold', 'min_score_threshold', 20, 'int'),
+            ('batch_max_articles', 'batch_max_articles', 30, 'int'),
+            ('enable_cache', 'enable_cache', True, 'bool'),
+            ('fallback_enabled', 'fallback_enabled', True, 'bool'),
+            ('test_mode', 'test_mode', False, 'bool'),
+            ('test_mode_delay', 'test_mode_delay', 0.5, 'double'),
+        ),
+        "chain": (
+            ('enable_keyword_filter', 'enable_keyword_filter', True, 'bool'),
+            ('enable_ai_filter', 'enable_ai_filter', True, 'bool'),
+            ('enable_deduplication', 'enable_deduplication', True, 'bool'),
+            ('final_score_threshold', 'final_score_threshold', 0.7, 'double'),
+            ('max_final_results', 'max_final_results', 30, 'int'),
+            ('sort_by', 'sort_by', 'final_score', 'str'),
+        ),
+        "deduplication": (
+            ('dedup_threshold', 'threshold', 0.8, 'double'),
+            ('dedup_time_window', 'time_window_hours', 72, 'int'),
+        ),
+        "ai_semantic_deduplication": (
+            ('enable_ai_semantic_dedup', 'enabled', True, 'bool'),
+            ('ai_semantic_threshold', 'threshold', 0.85, 'double'),
+            ('ai_semantic_time_window', 'time_window_hours', 48, 'int'),
+        ),
+    }
+
+    # 只属于AI Agent配置、不写入筛选配置文件的界面变量：(变量名, 类型, 默认值)
+    _AGENT_VAR_SPEC = (
+        ('current_agent_config', "str", ""),
+        ('provider', "str", ""),
+        ('temperature', "double", 0.0),
+        ('max_tokens', "int", 0),
+        ('timeout', "int", 0),
+        ('retry_times', "int", 0),
+        ('proxy', "str", ""),
+        ('verify_ssl', "bool", False),
+        ('prompt_config_name', "str", ""),
+    )
+
+    _field_vars_cache: Optional[Dict[Tuple[str, str], str]] = None
+
+    # 保存Agent配置时从界面变量同步的API配置字段（变量名与字段名相同）
+    _AGENT_API_FIELDS = ('provider', 'api_key', 'base_url', 'model_name', 'temperature',
+                         'max_tokens', 'timeout', 'retry_times', 'proxy', 'verify_ssl')
+
+    # 配置类型与Tk变量类的对应关系
+    _VAR_TYPES = {"double": tk.DoubleVar, "int": tk.IntVar, "bool": tk.BooleanVar, "str": tk.StringVar}
+
+    # 复用其他分区变量的字段：分区 -> ((配置键, 变量名), ...)
+    _SHARED_FIELDS = {
+        "chain": (
+            ('keyword_threshold', 'keyword_threshold'),
+            ('max_keyword_results', 'max_results'),
+            ('max_ai_requests', 'max_requests'),
+        ),
+    }
+
+    # 保存时写入的固定字段（界面中不可编辑）
+    _FIXED_FIELDS = {
+        "keyword": {
+            "keywords": {},
+            "weights": {},
+            "phrase_matching": True,
+            "min_keyword_length": 2
+        },
+        "ai": {
+            "temperature": 0.3,
+            "max_tokens": 1000,
+            "batch_size": 5,
+            "timeout": 30,
+            "retry_times": 3,
+            "retry_delay": 1,
+            "cache_ttl": 3600,
+            "cache_size": 1000,
+            "fallback_threshold": 0.7,
+            "min_confidence": 0.5
+        },
+        "chain": {
+            "fail_fast": False,
+            "enable_parallel": True,
+            "batch_size": 10,
+            "include_rejected": False,
+            "include_metrics": True
+        },
+    }
     
+    @classmethod
+    def show(cls, parent) -> "FilterConfigDialog":
+        """显示筛选配置对话框（模态），关闭后返回对话框实例，通过result判断是否已保存"""
+        instance = cls._instance
+        # 窗口挂在根窗口下，按根窗口复用；根窗口已更换（如旧根窗口已销毁）或窗口已被销毁时重新创建
+        if (instance is None or instance.dialog._root() is not parent._root()
+                or not instance.dialog.winfo_exists()):
+            instance = cls._instance = cls(parent)
+        instance.present(parent)
+        return instance
+
     def __init__(self, parent):
         self.parent = parent
         self.result = False
 
-        # 创建对话框
-        self.dialog = tk.Toplevel(parent)
+        # 创建对话框：挂在根窗口下，避免随某个调用方窗口一起销毁
+        self.dialog = tk.Toplevel(parent._root())
+        self.dialog.withdraw()
         self.dialog.title("筛选配置")
-        self.dialog.geometry("850x700")
+        self.dialog.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.dialog.resizable(True, True)
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        self._visible_var = tk.BooleanVar(master=self.dialog, value=False)
 
-        # 配置变量
+        # 配置变量：全部在此一次性创建，标签页中只引用
         self.config_vars = {}
+        for entries in self._SCHEMA.values():
+            for var_key, _, default, var_type in entries:
+                self.config_vars[var_key] = self._VAR_TYPES[var_type](master=self.dialog, value=default)
+        for var_key, var_type, default in self._AGENT_VAR_SPEC:
+            self.config_vars[var_key] = self._VAR_TYPES[var_type](master=self.dialog, value=default)
         self.keywords_data = {}  # 存储关键词数据
-        self.current_agent_config: Optional[AgentConfig] = None
+        self.current_agent_config: Optional["AgentConfig"] = None
+        self._value_labels = []  # 滑块数值标签的刷新回调
+        self._pending_label_updates = set()  # 待刷新的滑块数值标签
+        self._label_update_after_id = None
+        self._keyword_info_pending = False  # 是否已排队刷新关键词统计
+        self._keyword_io_thread = None  # 正在执行关键词文件读写的后台线程
+        self._dirty_sections = set()  # 加载后被用户修改过的配置分组
+        self._dirty_keys = set()  # 加载后被用户修改过的变量
+        self._debounce_after_ids = {}  # 防抖回调的after id
+        self._debounce_callbacks = {}  # 防抖回调函数，保存前需立即执行
+        self._preview_last = None  # 提示词预览当前显示的内容，未变化时跳过刷新
+        self._loading = False  # 正在把配置写入界面变量，此时的写入不算用户修改
+        self._agent_list_version = None  # Agent配置下拉框选项对应的配置数据版本
+
+        # 界面变量的初始值，复用窗口时先恢复，丢弃上次未保存的修改
+        self._initial_values = {}
+        self._register_vars()
 
         # 创建界面
         self.create_widgets()
-        self.load_current_config()
         self.center_window()
 
-        # 等待对话框关闭
-        self.dialog.wait_window()
+    def present(self, parent):
+        """显示对话框并重新加载配置，等待用户关闭"""
+        self.parent = parent
+        self.result = False
+        self.status_label.config(text="")
+        for name, value in self._initial_values.items():
+            self.config_vars[name].set(value)
+        if hasattr(self, 'agent_config_combo'):
+            # AI标签页已创建时，重新载入Agent专属设置（共享字段随后由配置文件覆盖）
+            self.load_agent_config_list()
+        self.load_current_config()
+        self.schedule_keyword_info_update()
+
+        self.dialog.transient(parent)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+
+        # 等待对话框隐藏（窗口会被复用，不能用wait_window等待销毁）
+        self._visible_var.set(True)
+        self.dialog.wait_variable(self._visible_var)
+
+    def hide(self):
+        """隐藏对话框，保留窗口以便下次打开时复用"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._visible_var.set(False)
     
     def center_window(self):
         """居中显示窗口"""
-        self.dialog.update_idletasks()
-        
-        # 获取窗口尺寸
-        width = self.dialog.winfo_width()
-        height = self.dialog.winfo_height()
+        # 窗口尺寸已知，无需update_idletasks强制完成布局再读取实际尺寸
+        width = self.WINDOW_WIDTH
+        height = self.WINDOW_HEIGHT
         
         # 获取屏幕尺寸
-        screen_width = self.dialog.winfo_screenwidth()
-        screen_height = self.dialog.winfo_screenheight()
+        cls = FilterConfigDialog
+        if cls._screen_size is None:
+            cls._screen_size = (self.dialog.winfo_screenwidth(), self.dialog.winfo_screenheight())
+        screen_width, screen_height = cls._screen_size
         
         # 计算居中位置
         x = (screen_width - width) // 2
@@ -59,18 +269,24 @@ class FilterConfigDialog:
         main_frame = ttk.Frame(self.dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        # 创建笔记本控件（标签页）
+        # 创建笔记本控件（标签页），各页内容在首次显示时才创建
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
-        
+        self._tab_builders = {}
+
         # 关键词筛选配置
-        self.create_keyword_config_tab(notebook)
-        
+        self._add_tab(notebook, "关键词筛选", self.create_keyword_config_tab)
+
         # AI筛选配置
-        self.create_ai_config_tab(notebook)
-        
+        self._add_tab(notebook, "AI筛选", self.create_ai_config_tab)
+
         # 筛选链配置
-        self.create_chain_config_tab(notebook)
+        self._add_tab(notebook, "筛选链", self.create_chain_config_tab)
+
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self._build_tab(notebook.select()))
+
+        # 默认显示的标签页在窗口显示后的空闲时创建，窗口框架先出现
+        self.dialog.after_idle(lambda: self._build_tab(notebook.select()))
         
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
@@ -79,144 +295,138 @@ class FilterConfigDialog:
         ttk.Button(button_frame, text="确定", command=self.save_config).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="取消", command=self.cancel).pack(side=tk.RIGHT)
         ttk.Button(button_frame, text="重置", command=self.reset_config).pack(side=tk.LEFT)
+
+        # 保存状态提示（代替弹出消息框）
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side=tk.RIGHT, padx=(0, 10))
     
-    def create_keyword_config_tab(self, notebook):
+    def _add_tab(self, notebook, text: str, builder):
+        """添加空白标签页，记录其内容创建函数"""
+        page = ttk.Frame(notebook)
+        notebook.add(page, text=text)
+        self._tab_builders[str(page)] = (builder, page)
+
+    def _build_tab(self, tab_id):
+        """首次显示标签页时创建其内容"""
+        entry = self._tab_builders.pop(str(tab_id), None)
+        if entry is None:
+            return
+        builder, page = entry
+
+        # 创建过程中载入界面的值（如Agent配置）不覆盖已从配置文件加载的变量，也不算用户修改；
+        # Agent专属变量由标签页有意载入，保留载入的值
+        values = {name: self.config_vars[name].get() for name in self._schema_var_names()}
+
+        # 先填充内容框架，最后再放入页面，只触发一次布局计算
+        content = ttk.Frame(page)
+        loading, self._loading = self._loading, True
+        try:
+            builder(content)
+            for name, value in values.items():
+                self.config_vars[name].set(value)
+        finally:
+            self._loading = loading
+        self._refresh_value_labels()
+        content.pack(fill=tk.BOTH, expand=True)
+
+    def create_keyword_config_tab(self, frame):
         """创建关键词筛选配置标签页"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="关键词筛选")
-        
-        # 滚动框架
-        canvas = tk.Canvas(frame)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
+        # 内容较少，各分组直接放在标签页中，无需Canvas滚动容器
+
         # 基本设置
-        basic_frame = ttk.LabelFrame(scrollable_frame, text="基本设置")
+        basic_frame = ttk.LabelFrame(frame, text="基本设置")
         basic_frame.pack(fill=tk.X, pady=(0, 10))
         
         # 筛选阈值
-        ttk.Label(basic_frame, text="筛选阈值 (0.0-1.0):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'keyword_threshold' not in self.config_vars:
-            self.config_vars['keyword_threshold'] = tk.DoubleVar()
         threshold_scale = ttk.Scale(basic_frame, from_=0.0, to=1.0,
                                   variable=self.config_vars['keyword_threshold'],
                                   orient=tk.HORIZONTAL, length=200)
-        threshold_scale.grid(row=0, column=1, padx=5, pady=5)
-
         threshold_label = ttk.Label(basic_frame, text="0.65")
-        threshold_label.grid(row=0, column=2, padx=5, pady=5)
+        self._grid_row(basic_frame, 0, "筛选阈值 (0.0-1.0):", threshold_scale, threshold_label, sticky="")
 
         # 更新标签显示
-        def update_threshold_label(*args):
-            threshold_label.config(text=f"{self.config_vars['keyword_threshold'].get():.2f}")
-        self.config_vars['keyword_threshold'].trace('w', update_threshold_label)
+        self._bind_value_label(threshold_scale, 'keyword_threshold', threshold_label)
 
         # 最大结果数
-        ttk.Label(basic_frame, text="最大结果数:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'max_results' not in self.config_vars:
-            self.config_vars['max_results'] = tk.IntVar()
-        ttk.Spinbox(basic_frame, from_=10, to=500, textvariable=self.config_vars['max_results'],
-                   width=10).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(basic_frame, 1, "最大结果数:", 'max_results', 10, 500)
 
         # 最少匹配关键词数
-        ttk.Label(basic_frame, text="最少匹配关键词数:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'min_matches' not in self.config_vars:
-            self.config_vars['min_matches'] = tk.IntVar()
-        ttk.Spinbox(basic_frame, from_=1, to=10, textvariable=self.config_vars['min_matches'],
-                   width=10).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(basic_frame, 2, "最少匹配关键词数:", 'min_matches', 1, 10)
         
         # 高级设置
-        advanced_frame = ttk.LabelFrame(scrollable_frame, text="高级设置")
+        advanced_frame = ttk.LabelFrame(frame, text="高级设置")
         advanced_frame.pack(fill=tk.X, pady=(0, 10))
         
         # 大小写敏感
-        if 'case_sensitive' not in self.config_vars:
-            self.config_vars['case_sensitive'] = tk.BooleanVar()
         ttk.Checkbutton(advanced_frame, text="大小写敏感",
                        variable=self.config_vars['case_sensitive']).pack(anchor=tk.W, padx=5, pady=2)
 
         # 模糊匹配
-        if 'fuzzy_match' not in self.config_vars:
-            self.config_vars['fuzzy_match'] = tk.BooleanVar()
         ttk.Checkbutton(advanced_frame, text="启用模糊匹配",
                        variable=self.config_vars['fuzzy_match']).pack(anchor=tk.W, padx=5, pady=2)
 
         # 单词边界检查
-        if 'word_boundary' not in self.config_vars:
-            self.config_vars['word_boundary'] = tk.BooleanVar()
         ttk.Checkbutton(advanced_frame, text="单词边界检查",
                        variable=self.config_vars['word_boundary']).pack(anchor=tk.W, padx=5, pady=2)
 
         # 关键词管理
-        keywords_frame = ttk.LabelFrame(scrollable_frame, text="关键词管理")
+        keywords_frame = ttk.LabelFrame(frame, text="关键词管理")
         keywords_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
         # 关键词编辑按钮
         keyword_buttons_frame = ttk.Frame(keywords_frame)
         keyword_buttons_frame.pack(fill=tk.X, padx=5, pady=5)
 
-        ttk.Button(keyword_buttons_frame, text="编辑关键词",
-                  command=self.open_keyword_editor).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(keyword_buttons_frame, text="导入关键词",
-                  command=self.import_keywords).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(keyword_buttons_frame, text="导出关键词",
-                  command=self.export_keywords).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(keyword_buttons_frame, text="重置为默认",
-                  command=self.reset_keywords).pack(side=tk.LEFT)
+        # 关键词文件读写在后台线程执行期间，这些按钮全部禁用
+        self._keyword_buttons = []
+        for text, command in (("编辑关键词", self.open_keyword_editor),
+                              ("导入关键词", self.import_keywords),
+                              ("导出关键词", self.export_keywords),
+                              ("重置为默认", self.reset_keywords)):
+            button = ttk.Button(keyword_buttons_frame, text=text, command=command)
+            button.pack(side=tk.LEFT, padx=(0, 5))
+            self._keyword_buttons.append(button)
 
         # 关键词统计信息
         self.keyword_info_label = ttk.Label(keywords_frame, text="", foreground="gray")
         self.keyword_info_label.pack(anchor=tk.W, padx=5, pady=2)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # 统计信息在界面显示后再计算，不阻塞对话框打开
+        self.schedule_keyword_info_update()
     
-    def create_ai_config_tab(self, notebook):
+    def create_ai_config_tab(self, frame):
         """创建AI筛选配置标签页"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="AI筛选")
-
-        # 创建滚动框架
-        canvas = tk.Canvas(frame)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # AI配置管理
-        self.create_ai_config_management(scrollable_frame)
-
-        # AI服务设置
-        self.create_ai_service_settings(scrollable_frame)
-
-        # 筛选设置
-        self.create_ai_filter_settings(scrollable_frame)
-
-        # 高级设置
-        self.create_ai_advanced_settings(scrollable_frame)
-
-        # 提示词设置
-        self.create_ai_prompt_settings(scrollable_frame)
-
-        # 性能设置
-        self.create_ai_performance_settings(scrollable_frame)
+        self._make_scroll_container(frame, (
+            self.create_ai_config_management,   # AI配置管理
+            self.create_ai_service_settings,    # AI服务设置
+            self.create_ai_filter_settings,     # 筛选设置
+            self.create_ai_advanced_settings,   # 高级设置
+            self.create_ai_prompt_settings,     # 提示词设置
+            self.create_ai_performance_settings,  # 性能设置
+        ))
 
-        canvas.pack(side="left", fill="both", expand=True)
+    def _make_scroll_container(self, parent, section_builders):
+        """创建可垂直滚动的分组容器，按顺序调用各分组的创建函数
+
+        各分组作为嵌入窗口放入只读Text中滚动，不需要Canvas在子组件尺寸变化时
+        反复计算bbox("all")。
+        """
+        background = ttk.Style().lookup("TFrame", "background")
+        text = tk.Text(parent, wrap=tk.NONE, borderwidth=0, highlightthickness=0,
+                       cursor="arrow", background=background)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+
+        for create_section in section_builders:
+            section_frame = ttk.Frame(text)
+            create_section(section_frame)
+            text.window_create(tk.END, window=section_frame)
+            text.insert(tk.END, "\n")
+        text.configure(state="disabled")
+
+        text.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        return text
 
     def create_ai_config_management(self, parent):
         """创建AI配置管理区域"""
@@ -225,12 +435,11 @@ class FilterConfigDialog:
 
         # 配置选择
         ttk.Label(config_frame, text="当前配置:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'current_agent_config' not in self.config_vars:
-            self.config_vars['current_agent_config'] = tk.StringVar()
         self.agent_config_combo = ttk.Combobox(config_frame, textvariable=self.config_vars['current_agent_config'],
                                               width=25, state="readonly")
         self.agent_config_combo.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W+tk.E)
-        self.agent_config_combo.bind("<<ComboboxSelected>>", self.on_agent_config_change)
+        self.agent_config_combo.bind("<<ComboboxSelected>>",
+                                     lambda e: self._debounced('agent_config', self.on_agent_config_change))
 
         # 配置管理按钮
         button_frame = ttk.Frame(config_frame)
@@ -252,39 +461,27 @@ class FilterConfigDialog:
         ai_frame.pack(fill=tk.X, pady=(0, 10), padx=5)
 
         # 服务提供商
-        ttk.Label(ai_frame, text="服务提供商:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'provider' not in self.config_vars:
-            self.config_vars['provider'] = tk.StringVar()
         provider_combo = ttk.Combobox(ai_frame, textvariable=self.config_vars['provider'],
-                                     values=["openai", "siliconflow", "volcengine", "moonshot", "custom"],
+                                     values=self.PROVIDERS,
                                      width=18, state="readonly")
-        provider_combo.grid(row=0, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
-        provider_combo.bind("<<ComboboxSelected>>", self.on_provider_change)
+        self._grid_row(ai_frame, 0, "服务提供商:", provider_combo, sticky=tk.W+tk.E)
+        provider_combo.bind("<<ComboboxSelected>>", lambda e: self._debounced('provider', self.on_provider_change))
 
         # API Key
-        ttk.Label(ai_frame, text="API Key:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'api_key' not in self.config_vars:
-            self.config_vars['api_key'] = tk.StringVar()
-        api_key_entry = ttk.Entry(ai_frame, textvariable=self.config_vars['api_key'],
-                                 width=35, show="*")
-        api_key_entry.grid(row=1, column=1, columnspan=2, sticky=tk.W+tk.E, padx=5, pady=5)
+        self._grid_row(ai_frame, 1, "API Key:",
+                       ttk.Entry(ai_frame, textvariable=self.config_vars['api_key'], width=35, show="*"),
+                       sticky=tk.W+tk.E, columnspan=2)
 
         # Base URL
-        ttk.Label(ai_frame, text="Base URL:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'base_url' not in self.config_vars:
-            self.config_vars['base_url'] = tk.StringVar()
-        ttk.Entry(ai_frame, textvariable=self.config_vars['base_url'], width=35).grid(
-            row=2, column=1, columnspan=2, sticky=tk.W+tk.E, padx=5, pady=5)
+        self._grid_row(ai_frame, 2, "Base URL:",
+                       ttk.Entry(ai_frame, textvariable=self.config_vars['base_url'], width=35),
+                       sticky=tk.W+tk.E, columnspan=2)
 
         # 模型名称
-        ttk.Label(ai_frame, text="模型名称:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'model_name' not in self.config_vars:
-            self.config_vars['model_name'] = tk.StringVar()
-        self.model_combo = ttk.Combobox(ai_frame, textvariable=self.config_vars['model_name'], width=28)
-        self.model_combo.grid(row=3, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
-
-        # 根据提供商更新模型列表
-        self.update_model_list()
+        # 候选模型在展开下拉列表时才按当前提供商填充
+        self.model_combo = ttk.Combobox(ai_frame, textvariable=self.config_vars['model_name'], width=28,
+                                        postcommand=self.populate_model_combo)
+        self._grid_row(ai_frame, 3, "模型名称:", self.model_combo, sticky=tk.W+tk.E)
 
         # 配置网格权重
         ai_frame.grid_columnconfigure(1, weight=1)
@@ -295,33 +492,15 @@ class FilterConfigDialog:
         filter_frame.pack(fill=tk.X, pady=(0, 10), padx=5)
 
         # 最大请求数
-        ttk.Label(filter_frame, text="最大请求数:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'max_requests' not in self.config_vars:
-            self.config_vars['max_requests'] = tk.IntVar()
-        ttk.Spinbox(filter_frame, from_=1, to=200, textvariable=self.config_vars['max_requests'],
-                   width=10).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-
-        # 分数阈值筛选
-        ttk.Label(filter_frame, text="最低分数阈值:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'min_score_threshold' not in self.config_vars:
-            self.config_vars['min_score_threshold'] = tk.IntVar()
-        ttk.Spinbox(filter_frame, from_=0, to=30, textvariable=self.config_vars['min_score_threshold'],
-                   width=10).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-
-        # 分数阈值说明
-        ttk.Label(filter_frame, text="(只选择超过此分数的文章)", font=("TkDefaultFont", 8)).grid(
-            row=1, column=2, sticky=tk.W, padx=5, pady=5)
-
-        # 批量筛选最大文章数
-        ttk.Label(filter_frame, text="批量最大文章数:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'batch_max_articles' not in self.config_vars:
-            self.config_vars['batch_max_articles'] = tk.IntVar()
-        ttk.Spinbox(filter_frame, from_=1, to=200, textvariable=self.config_vars['batch_max_articles'],
-                   width=10).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
-
-        # 批量筛选说明
-        ttk.Label(filter_frame, text="(批量筛选时达到此数量自动停止)", font=("TkDefaultFont", 8)).grid(
-            row=2, column=2, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(filter_frame, 0, "最大请求数:", 'max_requests', 1, 200)
+
+        # 分数阈值筛选（附说明）
+        self._spin_row(filter_frame, 1, "最低分数阈值:", 'min_score_threshold', 0, 30,
+                       "(只选择超过此分数的文章)", help_font=("TkDefaultFont", 8))
+
+        # 批量筛选最大文章数（附说明）
+        self._spin_row(filter_frame, 2, "批量最大文章数:", 'batch_max_articles', 1, 200,
+                       "(批量筛选时达到此数量自动停止)", help_font=("TkDefaultFont", 8))
 
     def create_ai_advanced_settings(self, parent):
         """创建AI高级设置区域"""
@@ -329,43 +508,23 @@ class FilterConfigDialog:
         advanced_frame.pack(fill=tk.X, pady=(0, 10), padx=5)
 
         # Temperature
-        ttk.Label(advanced_frame, text="Temperature (0.0-2.0):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'temperature' not in self.config_vars:
-            self.config_vars['temperature'] = tk.DoubleVar()
-        ttk.Spinbox(advanced_frame, from_=0.0, to=2.0, increment=0.1,
-                   textvariable=self.config_vars['temperature'], width=10).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(advanced_frame, 0, "Temperature (0.0-2.0):", 'temperature', 0.0, 2.0, increment=0.1)
 
         # Max Tokens
-        ttk.Label(advanced_frame, text="Max Tokens:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'max_tokens' not in self.config_vars:
-            self.config_vars['max_tokens'] = tk.IntVar()
-        ttk.Spinbox(advanced_frame, from_=100, to=4000, textvariable=self.config_vars['max_tokens'],
-                   width=10).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(advanced_frame, 1, "Max Tokens:", 'max_tokens', 100, 4000)
 
         # Timeout
-        ttk.Label(advanced_frame, text="超时时间(秒):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'timeout' not in self.config_vars:
-            self.config_vars['timeout'] = tk.IntVar()
-        ttk.Spinbox(advanced_frame, from_=10, to=120, textvariable=self.config_vars['timeout'],
-                   width=10).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(advanced_frame, 2, "超时时间(秒):", 'timeout', 10, 120)
 
         # Retry Times
-        ttk.Label(advanced_frame, text="重试次数:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'retry_times' not in self.config_vars:
-            self.config_vars['retry_times'] = tk.IntVar()
-        ttk.Spinbox(advanced_frame, from_=0, to=5, textvariable=self.config_vars['retry_times'],
-                   width=10).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(advanced_frame, 3, "重试次数:", 'retry_times', 0, 5)
 
         # Proxy
-        ttk.Label(advanced_frame, text="代理设置:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'proxy' not in self.config_vars:
-            self.config_vars['proxy'] = tk.StringVar()
-        ttk.Entry(advanced_frame, textvariable=self.config_vars['proxy'], width=28).grid(
-            row=4, column=1, columnspan=2, sticky=tk.W+tk.E, padx=5, pady=5)
+        self._grid_row(advanced_frame, 4, "代理设置:",
+                       ttk.Entry(advanced_frame, textvariable=self.config_vars['proxy'], width=28),
+                       sticky=tk.W+tk.E, columnspan=2)
 
         # SSL验证
-        if 'verify_ssl' not in self.config_vars:
-            self.config_vars['verify_ssl'] = tk.BooleanVar()
         ttk.Checkbutton(advanced_frame, text="启用SSL验证",
                        variable=self.config_vars['verify_ssl']).grid(row=5, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
 
@@ -378,14 +537,10 @@ class FilterConfigDialog:
         perf_frame.pack(fill=tk.X, padx=5)
 
         # 启用缓存
-        if 'enable_cache' not in self.config_vars:
-            self.config_vars['enable_cache'] = tk.BooleanVar()
         ttk.Checkbutton(perf_frame, text="启用缓存",
                        variable=self.config_vars['enable_cache']).pack(anchor=tk.W, padx=5, pady=2)
 
         # 启用降级策略
-        if 'fallback_enabled' not in self.config_vars:
-            self.config_vars['fallback_enabled'] = tk.BooleanVar()
         ttk.Checkbutton(perf_frame, text="启用降级策略",
                        variable=self.config_vars['fallback_enabled']).pack(anchor=tk.W, padx=5, pady=2)
         
@@ -394,8 +549,6 @@ class FilterConfigDialog:
         test_frame.pack(fill=tk.X, padx=5, pady=5)
         
         # 启用测试模式
-        if 'test_mode' not in self.config_vars:
-            self.config_vars['test_mode'] = tk.BooleanVar()
         ttk.Checkbutton(test_frame, text="启用测试模式 (使用模拟数据，不调用AI API)",
                        variable=self.config_vars['test_mode']).pack(anchor=tk.W)
         
@@ -404,8 +557,6 @@ class FilterConfigDialog:
         delay_frame.pack(fill=tk.X, pady=(5, 0))
         
         ttk.Label(delay_frame, text="测试模式延迟(秒):").pack(side=tk.LEFT)
-        if 'test_mode_delay' not in self.config_vars:
-            self.config_vars['test_mode_delay'] = tk.DoubleVar()
         ttk.Spinbox(delay_frame, from_=0.0, to=5.0, increment=0.1,
                    textvariable=self.config_vars['test_mode_delay'], width=8).pack(side=tk.LEFT, padx=(5, 0))
         
@@ -421,54 +572,12 @@ class FilterConfigDialog:
         config_select_frame.pack(fill=tk.X, padx=5, pady=5)
 
         ttk.Label(config_select_frame, text="提示词配置:").pack(side=tk.LEFT)
-        self.config_vars['prompt_config_name'] = tk.StringVar()
-        self.prompt_config_combo = ttk.Combobox(config_select_frame,
-                                               textvariable=self.config_vars['prompt_config_name'],
-                                               width=25, state="readonly")
-        self.prompt_config_combo.pack(side=tk.LEFT, padx=(5, 10))
-        self.prompt_config_combo.bind("<<ComboboxSelected>>", self.on_prompt_config_change)
-
-        # 提示词管理按钮
-        prompt_button_frame = ttk.Frame(config_select_frame)
-        prompt_button_frame.pack(side=tk.LEFT)
-
-        ttk.Button(prompt_button_frame, text="编辑", command=self.edit_prompt_config, width=8).pack(side=tk.LEFT, padx=2)
-        ttk.Button(prompt_button_frame, text="新建", command=self.new_prompt_config, width=8).pack(side=tk.LEFT, padx=2)
-        ttk.Button(prompt_button_frame, text="删除", command=self.delete_prompt_config, width=8).pack(side=tk.LEFT, padx=2)
-
-        # 提示词预览区域
-        preview_frame = ttk.Frame(prompt_frame)
-        preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        # 系统提示词预览
-        ttk.Label(preview_frame, text="系统提示词预览:").pack(anchor=tk.W)
-        self.system_prompt_preview = tk.Text(preview_frame, height=3, width=70, state="disabled", wrap=tk.WORD)
-        self.system_prompt_preview.pack(fill=tk.BOTH, pady=(2, 5))
-
-        # 评估提示词预览
-        ttk.Label(preview_frame, text="评估提示词预览:").pack(anchor=tk.W)
-        self.eval_prompt_preview = tk.Text(preview_frame, height=4, width=70, state="disabled", wrap=tk.WORD)
-        self.eval_prompt_preview.pack(fill=tk.BOTH, expand=True, pady=(2, 5))
-
-        # 加载提示词配置列表
-        self.load_prompt_config_list()
-
-    def create_ai_prompt_settings(self, parent):
-        """创建AI提示词设置区域"""
-        prompt_frame = ttk.LabelFrame(parent, text="提示词配置")
-        prompt_frame.pack(fill=tk.X, pady=(0, 10), padx=5)
-
-        # 提示词配置选择
-        config_select_frame = ttk.Frame(prompt_frame)
-        config_select_frame.pack(fill=tk.X, padx=5, pady=5)
-
-        ttk.Label(config_select_frame, text="提示词配置:").pack(side=tk.LEFT)
-        self.config_vars['prompt_config_name'] = tk.StringVar()
         self.prompt_config_combo = ttk.Combobox(config_select_frame,
                                                textvariable=self.config_vars['prompt_config_name'],
                                                width=25, state="readonly")
         self.prompt_config_combo.pack(side=tk.LEFT, padx=(5, 10))
-        self.prompt_config_combo.bind("<<ComboboxSelected>>", self.on_prompt_config_change)
+        self.prompt_config_combo.bind("<<ComboboxSelected>>",
+                                      lambda e: self._debounced('prompt_config', self.on_prompt_config_change))
 
         # 提示词管理按钮
         prompt_button_frame = ttk.Frame(config_select_frame)
@@ -482,43 +591,43 @@ class FilterConfigDialog:
         preview_frame = ttk.Frame(prompt_frame)
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+        # 预览只读，用自动换行的Label代替Text；外层固定尺寸，内容较长时截断显示
         # 系统提示词预览
         ttk.Label(preview_frame, text="系统提示词预览:").pack(anchor=tk.W)
-        self.system_prompt_preview = tk.Text(preview_frame, height=3, width=80, state="disabled", wrap=tk.WORD)
-        self.system_prompt_preview.pack(fill=tk.X, pady=(2, 5))
+        self.system_prompt_preview = self._create_preview_label(preview_frame, height=60)
 
         # 评估提示词预览
         ttk.Label(preview_frame, text="评估提示词预览:").pack(anchor=tk.W)
-        self.eval_prompt_preview = tk.Text(preview_frame, height=4, width=80, state="disabled", wrap=tk.WORD)
-        self.eval_prompt_preview.pack(fill=tk.X, pady=(2, 5))
+        self.eval_prompt_preview = self._create_preview_label(preview_frame, height=80)
 
         # 加载提示词配置列表
         self.load_prompt_config_list()
     
-    def create_chain_config_tab(self, notebook):
+    def _create_preview_label(self, parent, height: int):
+        """创建固定尺寸的只读预览标签"""
+        box = ttk.Frame(parent, width=self.PREVIEW_WRAP_LENGTH, height=height)
+        box.pack_propagate(False)
+        box.pack(fill=tk.X, pady=(2, 5))
+        label = ttk.Label(box, text="", wraplength=self.PREVIEW_WRAP_LENGTH, justify=tk.LEFT, anchor=tk.NW)
+        label.pack(fill=tk.BOTH, expand=True)
+        return label
+
+    def create_chain_config_tab(self, frame):
         """创建筛选链配置标签页"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="筛选链")
-        
+
         # 筛选流程设置
         flow_frame = ttk.LabelFrame(frame, text="筛选流程")
         flow_frame.pack(fill=tk.X, pady=(0, 10))
         
         # 启用关键词筛选
-        if 'enable_keyword_filter' not in self.config_vars:
-            self.config_vars['enable_keyword_filter'] = tk.BooleanVar()
         ttk.Checkbutton(flow_frame, text="启用关键词筛选",
                        variable=self.config_vars['enable_keyword_filter']).pack(anchor=tk.W, padx=5, pady=2)
 
         # 启用AI筛选
-        if 'enable_ai_filter' not in self.config_vars:
-            self.config_vars['enable_ai_filter'] = tk.BooleanVar()
         ttk.Checkbutton(flow_frame, text="启用AI筛选",
                        variable=self.config_vars['enable_ai_filter']).pack(anchor=tk.W, padx=5, pady=2)
 
         # 启用去重功能
-        if 'enable_deduplication' not in self.config_vars:
-            self.config_vars['enable_deduplication'] = tk.BooleanVar()
         ttk.Checkbutton(flow_frame, text="启用新闻去重",
                        variable=self.config_vars['enable_deduplication']).pack(anchor=tk.W, padx=5, pady=2)
 
@@ -527,215 +636,195 @@ class FilterConfigDialog:
         dedup_frame.pack(fill=tk.X, pady=(0, 10))
 
         # 相似度阈值
-        ttk.Label(dedup_frame, text="相似度阈值 (0.0-1.0):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'dedup_threshold' not in self.config_vars:
-            self.config_vars['dedup_threshold'] = tk.DoubleVar()
         dedup_scale = ttk.Scale(dedup_frame, from_=0.5, to=1.0,
                               variable=self.config_vars['dedup_threshold'],
                               orient=tk.HORIZONTAL, length=200)
-        dedup_scale.grid(row=0, column=1, padx=5, pady=5)
-
         dedup_label = ttk.Label(dedup_frame, text="0.80")
-        dedup_label.grid(row=0, column=2, padx=5, pady=5)
+        self._grid_row(dedup_frame, 0, "相似度阈值 (0.0-1.0):", dedup_scale, dedup_label, sticky="")
 
-        def update_dedup_label(*args):
-            dedup_label.config(text=f"{self.config_vars['dedup_threshold'].get():.2f}")
-        self.config_vars['dedup_threshold'].trace('w', update_dedup_label)
+        self._bind_value_label(dedup_scale, 'dedup_threshold', dedup_label)
 
         # 时间窗口
-        ttk.Label(dedup_frame, text="时间窗口 (小时):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'dedup_time_window' not in self.config_vars:
-            self.config_vars['dedup_time_window'] = tk.IntVar()
-        ttk.Spinbox(dedup_frame, from_=12, to=168, textvariable=self.config_vars['dedup_time_window'],
-                   width=10).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(dedup_frame, text="(12-168小时)").grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(dedup_frame, 1, "时间窗口 (小时):", 'dedup_time_window', 12, 168, "(12-168小时)")
 
-        # AI语义去重设置
-        ttk.Separator(dedup_frame, orient='horizontal').grid(row=2, column=0, columnspan=3, sticky='ew', pady=10)
+        # AI语义去重设置（用1像素高的Frame作分隔线，窗口缩放时无需平铺Separator的图片）
+        tk.Frame(dedup_frame, height=1, bg='#cccccc').grid(row=2, column=0, columnspan=3, sticky='ew', pady=10)
 
         # AI语义去重开关
-        if 'enable_ai_semantic_dedup' not in self.config_vars:
-            self.config_vars['enable_ai_semantic_dedup'] = tk.BooleanVar()
         ttk.Checkbutton(dedup_frame, text="启用AI语义去重（筛选后深度去重）",
                        variable=self.config_vars['enable_ai_semantic_dedup']).grid(row=3, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
 
         # AI语义相似度阈值
-        ttk.Label(dedup_frame, text="AI语义阈值 (0.7-1.0):").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'ai_semantic_threshold' not in self.config_vars:
-            self.config_vars['ai_semantic_threshold'] = tk.DoubleVar()
         ai_semantic_scale = ttk.Scale(dedup_frame, from_=0.7, to=1.0,
                                     variable=self.config_vars['ai_semantic_threshold'],
                                     orient=tk.HORIZONTAL, length=200)
-        ai_semantic_scale.grid(row=4, column=1, padx=5, pady=5)
-
         ai_semantic_label = ttk.Label(dedup_frame, text="0.85")
-        ai_semantic_label.grid(row=4, column=2, padx=5, pady=5)
+        self._grid_row(dedup_frame, 4, "AI语义阈值 (0.7-1.0):", ai_semantic_scale, ai_semantic_label, sticky="")
 
-        def update_ai_semantic_label(*args):
-            ai_semantic_label.config(text=f"{self.config_vars['ai_semantic_threshold'].get():.2f}")
-        self.config_vars['ai_semantic_threshold'].trace('w', update_ai_semantic_label)
+        self._bind_value_label(ai_semantic_scale, 'ai_semantic_threshold', ai_semantic_label)
 
         # AI语义时间窗口
-        ttk.Label(dedup_frame, text="AI语义时间窗口 (小时):").grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'ai_semantic_time_window' not in self.config_vars:
-            self.config_vars['ai_semantic_time_window'] = tk.IntVar()
-        ttk.Spinbox(dedup_frame, from_=12, to=72, textvariable=self.config_vars['ai_semantic_time_window'],
-                   width=10).grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(dedup_frame, text="(12-72小时)").grid(row=5, column=2, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(dedup_frame, 5, "AI语义时间窗口 (小时):", 'ai_semantic_time_window', 12, 72,
+                       "(12-72小时)")
 
         # 结果设置
         result_frame = ttk.LabelFrame(frame, text="结果设置")
         result_frame.pack(fill=tk.X, pady=(0, 10))
         
         # 最终分数阈值
-        ttk.Label(result_frame, text="最终分数阈值 (0.0-1.0):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'final_score_threshold' not in self.config_vars:
-            self.config_vars['final_score_threshold'] = tk.DoubleVar()
         final_scale = ttk.Scale(result_frame, from_=0.0, to=1.0,
                               variable=self.config_vars['final_score_threshold'],
                               orient=tk.HORIZONTAL, length=200)
-        final_scale.grid(row=0, column=1, padx=5, pady=5)
-
         final_label = ttk.Label(result_frame, text="0.70")
-        final_label.grid(row=0, column=2, padx=5, pady=5)
+        self._grid_row(result_frame, 0, "最终分数阈值 (0.0-1.0):", final_scale, final_label, sticky="")
 
-        def update_final_label(*args):
-            final_label.config(text=f"{self.config_vars['final_score_threshold'].get():.2f}")
-        self.config_vars['final_score_threshold'].trace('w', update_final_label)
+        self._bind_value_label(final_scale, 'final_score_threshold', final_label)
 
         # 最大最终结果数
-        ttk.Label(result_frame, text="最大最终结果数:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'max_final_results' not in self.config_vars:
-            self.config_vars['max_final_results'] = tk.IntVar()
-        ttk.Spinbox(result_frame, from_=1, to=100, textvariable=self.config_vars['max_final_results'],
-                   width=10).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        self._spin_row(result_frame, 1, "最大最终结果数:", 'max_final_results', 1, 100)
 
         # 排序方式
-        ttk.Label(result_frame, text="排序方式:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        if 'sort_by' not in self.config_vars:
-            self.config_vars['sort_by'] = tk.StringVar()
-        sort_combo = ttk.Combobox(result_frame, textvariable=self.config_vars['sort_by'],
-                                 values=["final_score", "relevance", "timestamp"], width=15)
-        sort_combo.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        self._grid_row(result_frame, 2, "排序方式:",
+                       ttk.Combobox(result_frame, textvariable=self.config_vars['sort_by'],
+                                    values=self.SORT_MODES, width=15, state="readonly"))
+
+    def _grid_row(self, parent, row: int, label: str, widget, extra=None,
+                  sticky=tk.W, columnspan: int = 1):
+        """按"标签 | 控件 | 附加标签"三列布局放置一行设置项"""
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+        widget.grid(row=row, column=1, columnspan=columnspan, sticky=sticky, padx=5, pady=5)
+        if extra is not None:
+            extra.grid(row=row, column=2, sticky=tk.W, padx=5, pady=5)
+        return widget
+
+    def _spin_row(self, parent, row: int, label: str, var_name: str, from_, to,
+                  help_text: Optional[str] = None, help_font=None, increment=1, width: int = 10):
+        """放置一行"标签 | 数值输入框 | 说明"设置项"""
+        spinbox = ttk.Spinbox(parent, from_=from_, to=to, increment=increment,
+                              textvariable=self.config_vars[var_name], width=width)
+        extra = ttk.Label(parent, text=help_text, font=help_font) if help_text else None
+        return self._grid_row(parent, row, label, spinbox, extra)
+
+    def _bind_value_label(self, scale, var_name: str, label):
+        """拖动滑块时将数值同步显示到标签"""
+        var = self.config_vars[var_name]
+        format_value = self._format_value
+
+        def update_label():
+            label.config(text=format_value(var.get()))
+
+        # Scale的command只在用户拖动时触发；程序写入变量后由_refresh_value_labels统一刷新
+        scale.configure(command=lambda value: self._schedule_label_update(update_label))
+        self._value_labels.append(update_label)
+
+    def _debounced(self, key: str, callback):
+        """防抖：同一key在SELECTION_DEBOUNCE_DELAY毫秒内再次触发时取消上一次，只执行最后一次"""
+        after_id = self._debounce_after_ids.pop(key, None)
+        if after_id is not None:
+            self.dialog.after_cancel(after_id)
+
+        def run():
+            self._debounce_after_ids.pop(key, None)
+            callback()
+
+        self._debounce_after_ids[key] = self.dialog.after(self.SELECTION_DEBOUNCE_DELAY, run)
+        self._debounce_callbacks[key] = run
+
+    def _flush_debounced(self):
+        """立即执行所有尚未触发的防抖回调（保存前调用，避免丢失刚做的选择）"""
+        pending = [(after_id, self._debounce_callbacks[key])
+                   for key, after_id in self._debounce_after_ids.items()]
+        for after_id, run in pending:
+            self.dialog.after_cancel(after_id)
+            run()
+
+    def _schedule_label_update(self, callback):
+        """合并标签刷新：拖动滑块时每LABEL_UPDATE_INTERVAL毫秒最多刷新一次，显示最新值"""
+        self._pending_label_updates.add(callback)
+        if self._label_update_after_id is None:
+            self._label_update_after_id = self.dialog.after(self.LABEL_UPDATE_INTERVAL,
+                                                            self._flush_label_updates)
+
+    def _flush_label_updates(self):
+        """执行待刷新的标签更新"""
+        self._label_update_after_id = None
+        pending, self._pending_label_updates = self._pending_label_updates, set()
+        for callback in pending:
+            callback()
+
+    def _refresh_value_labels(self):
+        """批量设置变量后统一刷新一次数值标签"""
+        for callback in self._value_labels:
+            callback()
     
+    @classmethod
+    def _schema_var_names(cls) -> Tuple[str, ...]:
+        """配置表中（写入配置文件）的界面变量名"""
+        return tuple(var_key for entries in cls._SCHEMA.values() for var_key, _, _, _ in entries)
+
+    def _register_vars(self):
+        """记录所有界面变量的初始值，并监听写入以记录被修改过的配置分组
+
+        变量在创建对话框时一次性创建，标签页只引用，因此只需调用一次；
+        不在配置表中的变量属于AI Agent配置。
+        """
+        var_sections = {var_key: section
+                        for section, entries in self._SCHEMA.items()
+                        for var_key, _, _, _ in entries}
+        for name, var in self.config_vars.items():
+            self._initial_values[name] = var.get()
+            section = var_sections.get(name, "ai")
+            var.trace_add('write', lambda *_, name=name, section=section: self._mark_dirty(name, section))
+
+    def _mark_dirty(self, name: str, section: str):
+        """记录被修改的变量及其所属配置分组"""
+        if self._loading:
+            return
+        self._dirty_keys.add(name)
+        self._dirty_sections.add(section)
+
     def load_current_config(self):
         """加载当前配置"""
+        loading, self._loading = self._loading, True
         try:
             # 直接从配置文件加载
             self.load_config_from_file()
 
             # 加载Agent配置列表（但不覆盖API设置）
-            self.load_agent_config_list_without_overriding()
-
-            # 加载关键词信息
-            self.update_keyword_info()
+            self.load_agent_config_list(load_to_ui=False)
 
         except Exception as e:
             messagebox.showerror("错误", f"加载配置失败: {e}")
+        finally:
+            self._loading = loading
 
-    def load_config_from_file(self):
-        """直接从配置文件加载配置"""
-        import json
-        from pathlib import Path
-
-        config_file = Path("config/filter_config.json")
-
-        # 默认配置
-        default_config = {
-            "keyword": {
-                "threshold": 0.65,
-                "max_results": 150,
-                "min_matches": 2,
-                "case_sensitive": False,
-                "fuzzy_match": True,
-                "word_boundary": True
-            },
-            "ai": {
-                "model_name": "gpt-3.5-turbo",
-                "api_key": "",
-                "base_url": "",
-                "max_requests": 50,
-                "max_selected": 3,
-                "enable_cache": True,
-                "fallback_enabled": True
-            },
-            "chain": {
-                "enable_keyword_filter": True,
-                "enable_ai_filter": True,
-                "enable_deduplication": True,
-                "final_score_threshold": 0.7,
-                "max_final_results": 30,
-                "sort_by": "final_score"
-            },
-            "deduplication": {
-                "threshold": 0.8,
-                "time_window_hours": 72
-            },
-            "ai_semantic_deduplication": {
-                "enabled": True,
-                "threshold": 0.85,
-                "time_window_hours": 48
-            }
-        }
-
-        # 如果配置文件存在，加载配置
-        if config_file.exists():
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    saved_config = json.load(f)
+        # 重新加载后丢弃之前记录的修改
+        self._dirty_sections.clear()
+        self._dirty_keys.clear()
 
-                # 合并配置（保存的配置覆盖默认配置）
-                for section in default_config:
-                    if section in saved_config:
-                        default_config[section].update(saved_config[section])
+    def load_config_from_file(self):
+        """直接从配置文件加载配置，文件中缺少的字段使用配置表中的默认值"""
+        config_file = _CONFIG_FILE
 
-                print(f"✅ 已从配置文件加载设置: {config_file}")
-            except Exception as e:
-                print(f"⚠️  读取配置文件失败，使用默认配置: {e}")
-        else:
+        # 如果配置文件存在，加载配置（文件未变化时使用缓存的解析结果）
+        try:
+            saved_config = load_json_cached(config_file)
+            print(f"✅ 已从配置文件加载设置: {config_file}")
+        except FileNotFoundError:
+            saved_config = {}
             print("📝 配置文件不存在，使用默认配置")
-
-        # 加载关键词配置
-        keyword_config = default_config["keyword"]
-        self.config_vars['keyword_threshold'].set(keyword_config.get('threshold', 0.65))
-        self.config_vars['max_results'].set(keyword_config.get('max_results', 150))
-        self.config_vars['min_matches'].set(keyword_config.get('min_matches', 2))
-        self.config_vars['case_sensitive'].set(keyword_config.get('case_sensitive', False))
-        self.config_vars['fuzzy_match'].set(keyword_config.get('fuzzy_match', True))
-        self.config_vars['word_boundary'].set(keyword_config.get('word_boundary', True))
-
-        # 加载AI配置
-        ai_config = default_config["ai"]
-        self.config_vars['max_requests'].set(ai_config.get('max_requests', 50))
-        self.config_vars['min_score_threshold'].set(ai_config.get('min_score_threshold', 20))
-        self.config_vars['batch_max_articles'].set(ai_config.get('batch_max_articles', 30))
-        self.config_vars['enable_cache'].set(ai_config.get('enable_cache', True))
-        self.config_vars['fallback_enabled'].set(ai_config.get('fallback_enabled', True))
-        self.config_vars['test_mode'].set(ai_config.get('test_mode', False))
-        self.config_vars['test_mode_delay'].set(ai_config.get('test_mode_delay', 0.5))
-        self.config_vars['api_key'].set(ai_config.get('api_key', ''))
-        self.config_vars['model_name'].set(ai_config.get('model_name', 'gpt-3.5-turbo'))
-        self.config_vars['base_url'].set(ai_config.get('base_url', ''))
-
-        # 加载筛选链配置
-        chain_config = default_config["chain"]
-        self.config_vars['enable_keyword_filter'].set(chain_config.get('enable_keyword_filter', True))
-        self.config_vars['enable_ai_filter'].set(chain_config.get('enable_ai_filter', True))
-        self.config_vars['enable_deduplication'].set(chain_config.get('enable_deduplication', True))
-        self.config_vars['final_score_threshold'].set(chain_config.get('final_score_threshold', 0.7))
-        self.config_vars['max_final_results'].set(chain_config.get('max_final_results', 30))
-        self.config_vars['sort_by'].set(chain_config.get('sort_by', 'final_score'))
-
-        # 加载去重配置
-        dedup_config = default_config["deduplication"]
-        self.config_vars['dedup_threshold'].set(dedup_config.get('threshold', 0.8))
-        self.config_vars['dedup_time_window'].set(dedup_config.get('time_window_hours', 72))
-
-        # 加载AI语义去重配置
-        ai_dedup_config = default_config["ai_semantic_deduplication"]
-        self.config_vars['enable_ai_semantic_dedup'].set(ai_dedup_config.get('enabled', True))
-        self.config_vars['ai_semantic_threshold'].set(ai_dedup_config.get('threshold', 0.85))
-        self.config_vars['ai_semantic_time_window'].set(ai_dedup_config.get('time_window_hours', 48))
+        except Exception as e:
+            saved_config = {}
+            print(f"⚠️  读取配置文件失败，使用默认配置: {e}")
+
+        # 按配置表批量写入界面变量
+        for section, entries in self._SCHEMA.items():
+            section_config = saved_config.get(section)
+            if not isinstance(section_config, dict):
+                section_config = {}
+            for var_key, cfg_key, default, _ in entries:
+                self.config_vars[var_key].set(section_config.get(cfg_key, default))
+        self._refresh_value_labels()
 
     def sync_agent_config_to_filter_service(self):
         """同步Agent配置到FilterService"""
@@ -755,118 +844,109 @@ class FilterConfigDialog:
 
     def save_config(self):
         """保存配置"""
+        self._flush_debounced()
         try:
-            # 直接保存到配置文件
-            self.save_config_to_file()
-
-            # 保存AI Agent配置（如果有的话）
-            if self.current_agent_config:
-                self.save_current_agent_config()
-
-            # 通知FilterService重新加载配置（保持兼容性）
-            try:
-                get_filter_service().reload_config()
-            except:
-                pass  # 如果reload_config方法不存在，忽略错误
+            # 先保存AI Agent配置（仅在AI设置被修改过时），其同步FilterService时可能改写配置文件
+            agent_saved = False
+            if self.current_agent_config and "ai" in self._dirty_sections:
+                agent_saved = self.save_current_agent_config()
+
+            # 最后写入配置文件，保证对话框中修改过的设置不被覆盖
+            file_saved = self.save_config_to_file()
+
+            # 配置有变化时通知FilterService重新加载配置（保持兼容性）
+            if agent_saved or file_saved:
+                try:
+                    get_filter_service().reload_config()
+                except:
+                    pass  # 如果reload_config方法不存在，忽略错误
+            self._dirty_sections.clear()
+            self._dirty_keys.clear()
 
             self.result = True
-            messagebox.showinfo("成功", "配置已保存")
-            self.dialog.destroy()
+            self.status_label.config(text="✓ 已保存", foreground="green")
+            self.dialog.after(400, self.hide)
 
         except Exception as e:
             messagebox.showerror("错误", f"保存配置失败: {e}")
 
-    def save_config_to_file(self):
-        """直接保存配置到文件"""
-        import json
-        from pathlib import Path
-
-        config_file = Path("config/filter_config.json")
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # 构建配置数据
-        config_data = {
-            "keyword": {
-                "keywords": {},
-                "weights": {},
-                "threshold": self.config_vars['keyword_threshold'].get(),
-                "max_results": self.config_vars['max_results'].get(),
-                "case_sensitive": self.config_vars['case_sensitive'].get(),
-                "fuzzy_match": self.config_vars['fuzzy_match'].get(),
-                "word_boundary": self.config_vars['word_boundary'].get(),
-                "phrase_matching": True,
-                "min_keyword_length": 2,
-                "min_matches": self.config_vars['min_matches'].get()
-            },
-            "ai": {
-                "model_name": self.config_vars['model_name'].get(),
-                "api_key": self.config_vars['api_key'].get(),
-                "base_url": self.config_vars['base_url'].get(),
-                "temperature": 0.3,
-                "max_tokens": 1000,
-                "max_requests": self.config_vars['max_requests'].get(),
-                "min_score_threshold": self.config_vars['min_score_threshold'].get(),
-                "batch_max_articles": self.config_vars['batch_max_articles'].get(),
-                "batch_size": 5,
-                "timeout": 30,
-                "retry_times": 3,
-                "retry_delay": 1,
-                "enable_cache": self.config_vars['enable_cache'].get(),
-                "cache_ttl": 3600,
-                "cache_size": 1000,
-                "fallback_enabled": self.config_vars['fallback_enabled'].get(),
-                "fallback_threshold": 0.7,
-                "min_confidence": 0.5,
-                "test_mode": self.config_vars['test_mode'].get(),
-                "test_mode_delay": self.config_vars['test_mode_delay'].get()
-            },
-            "chain": {
-                "enable_keyword_filter": self.config_vars['enable_keyword_filter'].get(),
-                "enable_ai_filter": self.config_vars['enable_ai_filter'].get(),
-                "enable_deduplication": self.config_vars['enable_deduplication'].get(),
-                "keyword_threshold": self.config_vars['keyword_threshold'].get(),
-                "final_score_threshold": self.config_vars['final_score_threshold'].get(),
-                "max_keyword_results": self.config_vars['max_results'].get(),
-                "max_ai_requests": self.config_vars['max_requests'].get(),
-                "max_final_results": self.config_vars['max_final_results'].get(),
-                "fail_fast": False,
-                "enable_parallel": True,
-                "batch_size": 10,
-                "sort_by": self.config_vars['sort_by'].get(),
-                "include_rejected": False,
-                "include_metrics": True
-            },
-            "deduplication": {
-                "threshold": self.config_vars['dedup_threshold'].get(),
-                "time_window_hours": self.config_vars['dedup_time_window'].get()
-            },
-            "ai_semantic_deduplication": {
-                "enabled": self.config_vars['enable_ai_semantic_dedup'].get(),
-                "threshold": self.config_vars['ai_semantic_threshold'].get(),
-                "time_window_hours": self.config_vars['ai_semantic_time_window'].get()
-            }
-        }
-
-        # 保存到文件
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=2)
+    def save_config_to_file(self) -> bool:
+        """将修改过的设置合并到配置文件中，返回是否实际写入
+
+        只覆盖用户修改过的字段和文件中缺失的字段，文件中其他内容（包括其他模块
+        写入、对话框不管理的字段）保持不变；内容未变化时不写入。
+        """
+        config_file = _CONFIG_FILE
+        os.makedirs(os.path.dirname(config_file), exist_ok=True)
+
+        # 读取磁盘上的当前内容（可能已被Agent配置同步改写）
+        try:
+            on_disk = load_json_cached(config_file)
+        except (OSError, ValueError):
+            on_disk = {}
+
+        # 缓存的解析结果只读：逐分组复制后再合并
+        config_data = {section: dict(values) if isinstance(values, dict) else values
+                       for section, values in on_disk.items()}
+        field_vars = self._field_vars()
+        for section, values in self._collect_config_data().items():
+            target = config_data.get(section)
+            if not isinstance(target, dict):
+                config_data[section] = values
+                continue
+            for cfg_key, value in values.items():
+                if cfg_key not in target or field_vars.get((section, cfg_key)) in self._dirty_keys:
+                    target[cfg_key] = value
+
+        # 配置未变化时无需重写
+        if config_data == on_disk:
+            logger.debug("配置未变化，跳过写入")
+            return False
+
+        # 先写临时文件再替换，避免写入中断留下损坏的配置文件
+        atomic_write_bytes(config_file, config_json_dumps(config_data))
+        store_json_cache(config_file, config_data)
 
         print(f"✅ 配置已保存到: {config_file}")
+        return True
+
+    @classmethod
+    def _field_vars(cls) -> Dict[Tuple[str, str], str]:
+        """配置字段 (分组, 字段名) 到界面变量名的映射（由配置表生成一次后复用）"""
+        if cls._field_vars_cache is None:
+            field_vars = {(section, cfg_key): var_key
+                          for section, entries in cls._SCHEMA.items()
+                          for var_key, cfg_key, _, _ in entries}
+            for section, fields in cls._SHARED_FIELDS.items():
+                for cfg_key, var_key in fields:
+                    field_vars[(section, cfg_key)] = var_key
+            cls._field_vars_cache = field_vars
+        return cls._field_vars_cache
+
+    def _collect_config_data(self) -> Dict[str, Dict[str, Any]]:
+        """按配置表从界面变量收集配置数据"""
+        config_data = {}
+        for section, entries in self._SCHEMA.items():
+            section_data = {cfg_key: self.config_vars[var_key].get()
+                            for var_key, cfg_key, _, _ in entries}
+            for cfg_key, var_key in self._SHARED_FIELDS.get(section, ()):
+                section_data[cfg_key] = self.config_vars[var_key].get()
+            section_data.update(self._FIXED_FIELDS.get(section, {}))
+            config_data[section] = section_data
+        return config_data
     
     def reset_config(self):
         """重置配置"""
         if messagebox.askyesno("确认", "确定要重置所有配置到默认值吗？"):
+            clear_config_cache()
             self.load_current_config()
     
     def cancel(self):
         """取消"""
-        self.dialog.destroy()
+        self.hide()
 
     def open_keyword_editor(self):
         """打开关键词编辑器"""
-        from .keyword_editor_dialog import KeywordEditorDialog
-        from ..config.keyword_config import keyword_config_manager
-
         # 获取当前关键词数据
         self.keywords_data = keyword_config_manager.get_keywords()
 
@@ -877,30 +957,26 @@ class FilterConfigDialog:
         if editor.result:
             keyword_config_manager.update_keywords(self.keywords_data)
 
-        self.update_keyword_info()
+        self.schedule_keyword_info_update()
 
     def import_keywords(self):
         """导入关键词"""
-        from tkinter import filedialog, messagebox
-        from ..config.keyword_config import keyword_config_manager
-
         file_path = filedialog.askopenfilename(
             title="导入关键词文件",
             filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")]
         )
 
         if file_path:
-            if keyword_config_manager.import_keywords(file_path, merge=True):
-                self.update_keyword_info()
-                messagebox.showinfo("成功", "关键词导入成功")
-            else:
-                messagebox.showerror("错误", "关键词导入失败")
+            def on_done(success):
+                if success:
+                    messagebox.showinfo("成功", "关键词导入成功")
+                else:
+                    messagebox.showerror("错误", "关键词导入失败")
+
+            self._run_keyword_io(on_done, keyword_config_manager.import_keywords, file_path, True)
 
     def export_keywords(self):
         """导出关键词"""
-        from tkinter import filedialog, messagebox
-        from ..config.keyword_config import keyword_config_manager
-
         file_path = filedialog.asksaveasfilename(
             title="导出关键词文件",
             defaultextension=".json",
@@ -908,25 +984,67 @@ class FilterConfigDialog:
         )
 
         if file_path:
-            if keyword_config_manager.export_keywords(file_path):
-                messagebox.showinfo("成功", "关键词导出成功")
-            else:
-                messagebox.showerror("错误", "关键词导出失败")
+            def on_done(success):
+                if success:
+                    messagebox.showinfo("成功", "关键词导出成功")
+                else:
+                    messagebox.showerror("错误", "关键词导出失败")
+
+            self._run_keyword_io(on_done, keyword_config_manager.export_keywords, file_path)
+
+    def _run_keyword_io(self, on_done, func, *args):
+        """在后台线程执行关键词文件读写，完成后在界面线程回调on_done
+
+        keyword_config_manager没有加锁，读写期间禁用所有关键词按钮，
+        并暂停刷新关键词统计，界面线程不会同时访问它。
+        """
+        for button in self._keyword_buttons:
+            button.config(state="disabled")
+
+        outcome = []
+
+        def task():
+            try:
+                outcome.append(func(*args))
+            except Exception:
+                logger.debug("关键词文件读写失败", exc_info=True)
+
+        # 单独的守护线程，不用进程级线程池：退出程序时不必等待文件读写完成
+        self._keyword_io_thread = threading.Thread(target=task, name="keyword-io", daemon=True)
+        self._keyword_io_thread.start()
+
+        def poll():
+            if self._keyword_io_thread.is_alive():
+                self.dialog.after(50, poll)
+                return
+            self._keyword_io_thread = None
+            for button in self._keyword_buttons:
+                button.config(state="normal")
+            self.schedule_keyword_info_update()
+            on_done(bool(outcome and outcome[0]))
+
+        self.dialog.after(50, poll)
 
     def reset_keywords(self):
         """重置为默认关键词"""
-        from tkinter import messagebox
-        from ..config.keyword_config import keyword_config_manager
-
         if messagebox.askyesno("确认", "确定要重置为默认关键词吗？这将覆盖当前的自定义关键词。"):
             keyword_config_manager.reset_to_default()
-            self.update_keyword_info()
+            self.schedule_keyword_info_update()
             messagebox.showinfo("成功", "已重置为默认关键词")
 
+    def schedule_keyword_info_update(self):
+        """在空闲时刷新关键词统计信息，多次请求只执行一次"""
+        if self._keyword_info_pending:
+            return
+        self._keyword_info_pending = True
+        self.dialog.after_idle(self.update_keyword_info)
+
     def update_keyword_info(self):
         """更新关键词统计信息"""
-        from ..config.keyword_config import keyword_config_manager
-
+        self._keyword_info_pending = False
+        if self._keyword_io_thread is not None:
+            # 后台线程正在读写关键词，完成后会重新刷新
+            return
         stats = keyword_config_manager.get_statistics()
         total_keywords = stats['total_keywords']
         categories = stats['total_categories']
@@ -935,74 +1053,41 @@ class FilterConfigDialog:
         self.keyword_info_label.config(text=info_text)
 
     # AI配置管理相关方法
-    def load_agent_config_list(self):
-        """加载AI Agent配置列表"""
-        try:
-            # 确保agent_config_combo存在
-            if not hasattr(self, 'agent_config_combo'):
-                print("agent_config_combo 不存在，跳过AI配置加载")
-                return
-
-            # 确保current_agent_config变量存在
-            if 'current_agent_config' not in self.config_vars:
-                self.config_vars['current_agent_config'] = tk.StringVar()
-
-            config_list = agent_config_manager.get_config_list()
-            self.agent_config_combo['values'] = config_list
-
-            # 设置当前配置
-            current_config = agent_config_manager.get_current_config()
-            if current_config:
-                self.config_vars['current_agent_config'].set(current_config.config_name)
-                self.current_agent_config = current_config
-                self.load_agent_config_to_ui(current_config)
-            elif config_list:
-                # 如果没有当前配置，选择第一个
-                first_config = agent_config_manager.load_config(config_list[0])
-                if first_config:
-                    self.config_vars['current_agent_config'].set(config_list[0])
-                    self.current_agent_config = first_config
-                    self.load_agent_config_to_ui(first_config)
-        except Exception as e:
-            print(f"加载AI配置列表失败: {e}")
-            import traceback
-            traceback.print_exc()
+    def load_agent_config_list(self, load_to_ui: bool = True):
+        """加载AI Agent配置列表并选中当前配置
 
-    def load_agent_config_list_without_overriding(self):
-        """加载AI Agent配置列表但不覆盖API设置"""
+        load_to_ui为False时只记录当前配置，不把其API设置载入界面（避免覆盖已加载的设置）。
+        """
+        from ..config.agent_config import agent_config_manager
         try:
-            # 确保agent_config_combo存在
+            # AI标签页尚未创建时（首次打开对话框的正常情况）跳过，创建标签页时会再加载
             if not hasattr(self, 'agent_config_combo'):
-                print("agent_config_combo 不存在，跳过AI配置加载")
                 return
 
-            # 确保current_agent_config变量存在
-            if 'current_agent_config' not in self.config_vars:
-                self.config_vars['current_agent_config'] = tk.StringVar()
-
-            config_list = agent_config_manager.get_config_list()
-            self.agent_config_combo['values'] = config_list
+            # 配置数据未变化时沿用下拉框中已有的选项
+            version = agent_config_manager.get_version()
+            if version != self._agent_list_version:
+                self.agent_config_combo['values'] = agent_config_manager.get_config_list()
+                self._agent_list_version = version
 
-            # 设置当前配置但不加载到UI（避免覆盖API设置）
+            # 设置当前配置，没有当前配置时选择第一个
             current_config = agent_config_manager.get_current_config()
+            if current_config is None:
+                config_list = agent_config_manager.get_config_list()
+                if config_list:
+                    current_config = agent_config_manager.load_config(config_list[0])
             if current_config:
                 self.config_vars['current_agent_config'].set(current_config.config_name)
                 self.current_agent_config = current_config
-                # 不调用 load_agent_config_to_ui，避免覆盖API设置
-            elif config_list:
-                # 如果没有当前配置，选择第一个但不加载到UI
-                first_config = agent_config_manager.load_config(config_list[0])
-                if first_config:
-                    self.config_vars['current_agent_config'].set(config_list[0])
-                    self.current_agent_config = first_config
-                    # 不调用 load_agent_config_to_ui，避免覆盖API设置
+                if load_to_ui:
+                    self.load_agent_config_to_ui(current_config)
         except Exception as e:
-            print(f"加载AI配置列表失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("加载AI配置列表失败: %s", e)
+            logger.debug("加载AI配置列表失败", exc_info=True)
 
     def on_agent_config_change(self, event=None):
         """AI配置选择变化事件"""
+        from ..config.agent_config import agent_config_manager
         config_name = self.config_vars['current_agent_config'].get()
         if config_name:
             try:
@@ -1017,27 +1102,11 @@ class FilterConfigDialog:
             except Exception as e:
                 messagebox.showerror("错误", f"加载配置失败: {e}")
 
-    def load_agent_config_to_ui(self, config: AgentConfig):
+    def load_agent_config_to_ui(self, config: "AgentConfig"):
         """将AI配置加载到界面"""
+        loading, self._loading = self._loading, True
         try:
-            # 确保所有变量都已初始化
-            required_vars = {
-                'provider': tk.StringVar,
-                'api_key': tk.StringVar,
-                'base_url': tk.StringVar,
-                'model_name': tk.StringVar,
-                'temperature': tk.DoubleVar,
-                'max_tokens': tk.IntVar,
-                'timeout': tk.IntVar,
-                'retry_times': tk.IntVar,
-                'proxy': tk.StringVar,
-                'verify_ssl': tk.BooleanVar
-            }
-
-            for var_name, var_type in required_vars.items():
-                if var_name not in self.config_vars:
-                    self.config_vars[var_name] = var_type()
-
+            # 所需变量均已在创建对话框时按_SCHEMA和_AGENT_VAR_SPEC初始化
             # API配置
             self.config_vars['provider'].set(config.api_config.provider)
             self.config_vars['api_key'].set(config.api_config.api_key)
@@ -1064,56 +1133,50 @@ class FilterConfigDialog:
                     # 如果没有提示词配置，清空选择
                     self.config_vars['prompt_config_name'].set("")
                     if hasattr(self, 'system_prompt_preview'):
-                        self.system_prompt_preview.config(state="normal")
-                        self.system_prompt_preview.delete("1.0", tk.END)
-                        self.system_prompt_preview.config(state="disabled")
+                        self.system_prompt_preview.config(text="")
                     if hasattr(self, 'eval_prompt_preview'):
-                        self.eval_prompt_preview.config(state="normal")
-                        self.eval_prompt_preview.delete("1.0", tk.END)
-                        self.eval_prompt_preview.config(state="disabled")
+                        self.eval_prompt_preview.config(text="")
+                    self._preview_last = None
 
         except Exception as e:
-            print(f"加载AI配置到界面失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("加载AI配置到界面失败: %s", e)
+            logger.debug("加载AI配置到界面失败", exc_info=True)
+        finally:
+            self._loading = loading
 
     def on_provider_change(self, event=None):
         """服务提供商变化事件"""
         self.update_model_list()
 
+    def get_provider_models(self):
+        """获取当前服务提供商的候选模型列表"""
+        provider = self.config_vars['provider'].get()
+        return self.MODEL_LISTS.get(provider, self.DEFAULT_MODELS)
+
+    def populate_model_combo(self):
+        """展开模型下拉列表时填充候选模型"""
+        self.model_combo['values'] = self.get_provider_models()
+
     def update_model_list(self):
         """根据服务提供商更新模型列表"""
         try:
-            # 确保必要的变量和组件存在
-            if 'provider' not in self.config_vars:
-                return
+            # 确保模型下拉框已创建
             if not hasattr(self, 'model_combo'):
                 return
 
-            provider = self.config_vars['provider'].get()
-
-            model_lists = {
-                "openai": ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4o"],
-                "siliconflow": ["Qwen/Qwen2.5-72B-Instruct", "Qwen/Qwen2.5-32B-Instruct",
-                               "meta-llama/Meta-Llama-3.1-70B-Instruct", "deepseek-ai/DeepSeek-V2.5"],
-                "volcengine": ["ep-20241219105006-xxxxx", "自定义Endpoint"],
-                "moonshot": ["moonshot-v1-8k", "moonshot-v1-32k", "moonshot-v1-128k"],
-                "custom": ["自定义模型"]
-            }
-
-            models = model_lists.get(provider, ["gpt-3.5-turbo"])
-            self.model_combo['values'] = models
+            # 下拉列表内容由postcommand在展开时填充，这里只校验当前模型
+            models = self.get_provider_models()
 
             # 如果当前模型不在列表中，设置为第一个
-            if 'model_name' in self.config_vars:
-                current_model = self.config_vars['model_name'].get()
-                if current_model not in models and models:
-                    self.config_vars['model_name'].set(models[0])
+            current_model = self.config_vars['model_name'].get()
+            if current_model not in models and models:
+                self.config_vars['model_name'].set(models[0])
         except Exception as e:
             print(f"更新模型列表失败: {e}")
 
     def new_agent_config(self):
         """新建AI配置"""
+        from ..config.agent_config import agent_config_manager, AgentConfig, AgentAPIConfig, AgentPromptConfig
         try:
             # 创建新的配置对象
             new_api_config = AgentAPIConfig(
@@ -1164,6 +1227,7 @@ class FilterConfigDialog:
 
     def delete_agent_config(self):
         """删除AI配置"""
+        from ..config.agent_config import agent_config_manager
         if not self.current_agent_config:
             messagebox.showwarning("提示", "请先选择要删除的配置")
             return
@@ -1182,6 +1246,7 @@ class FilterConfigDialog:
 
     def load_prompt_config_list(self):
         """加载提示词配置列表"""
+        from ..config.agent_config import agent_config_manager
         try:
             # 获取所有提示词配置
             prompt_configs = agent_config_manager.get_all_prompt_configs()
@@ -1210,6 +1275,7 @@ class FilterConfigDialog:
 
     def update_prompt_preview(self):
         """更新提示词预览"""
+        from ..config.agent_config import agent_config_manager
         try:
             prompt_name = self.config_vars['prompt_config_name'].get()
             if not prompt_name:
@@ -1220,23 +1286,29 @@ class FilterConfigDialog:
             prompt_config = prompt_configs.get(prompt_name)
 
             if prompt_config:
+                # 显示内容未变化时不重新设置文本，避免重复布局
+                preview = (prompt_name, prompt_config.system_prompt, prompt_config.evaluation_prompt)
+                if preview == self._preview_last:
+                    return
+
                 # 更新系统提示词预览
-                self.system_prompt_preview.config(state="normal")
-                self.system_prompt_preview.delete("1.0", tk.END)
-                self.system_prompt_preview.insert("1.0", prompt_config.system_prompt[:200] + "..." if len(prompt_config.system_prompt) > 200 else prompt_config.system_prompt)
-                self.system_prompt_preview.config(state="disabled")
+                self.system_prompt_preview.config(text=self._truncate_preview(prompt_config.system_prompt, 200))
 
                 # 更新评估提示词预览
-                self.eval_prompt_preview.config(state="normal")
-                self.eval_prompt_preview.delete("1.0", tk.END)
-                self.eval_prompt_preview.insert("1.0", prompt_config.evaluation_prompt[:300] + "..." if len(prompt_config.evaluation_prompt) > 300 else prompt_config.evaluation_prompt)
-                self.eval_prompt_preview.config(state="disabled")
+                self.eval_prompt_preview.config(text=self._truncate_preview(prompt_config.evaluation_prompt, 300))
+                self._preview_last = preview
 
         except Exception as e:
             print(f"更新提示词预览失败: {e}")
 
+    @staticmethod
+    def _truncate_preview(text: str, limit: int) -> str:
+        """截断预览文本，超出部分以省略号表示"""
+        return text[:limit] + "..." if len(text) > limit else text
+
     def edit_prompt_config(self):
         """编辑提示词配置"""
+        from ..config.agent_config import agent_config_manager
         prompt_name = self.config_vars['prompt_config_name'].get()
         if not prompt_name:
             messagebox.showwarning("提示", "请先选择要编辑的提示词配置")
@@ -1261,6 +1333,7 @@ class FilterConfigDialog:
 
     def new_prompt_config(self):
         """新建提示词配置"""
+        from ..config.agent_config import agent_config_manager, AgentPromptConfig
         try:
             # 创建新的提示词配置
             new_prompt_config = AgentPromptConfig(
@@ -1286,6 +1359,7 @@ class FilterConfigDialog:
 
     def delete_prompt_config(self):
         """删除提示词配置"""
+        from ..config.agent_config import agent_config_manager
         prompt_name = self.config_vars['prompt_config_name'].get()
         if not prompt_name:
             messagebox.showwarning("提示", "请先选择要删除的提示词配置")
@@ -1299,32 +1373,39 @@ class FilterConfigDialog:
             except Exception as e:
                 messagebox.showerror("错误", f"删除提示词配置失败: {e}")
 
-    def save_current_agent_config(self):
-        """保存当前AI Agent配置"""
+    def save_current_agent_config(self) -> bool:
+        """保存当前AI Agent配置，返回是否有变化并写入了文件"""
+        from ..config.agent_config import agent_config_manager
         if not self.current_agent_config:
-            return
+            return False
 
         try:
-            # 更新API配置
-            self.current_agent_config.api_config.provider = self.config_vars['provider'].get()
-            self.current_agent_config.api_config.api_key = self.config_vars['api_key'].get()
-            self.current_agent_config.api_config.base_url = self.config_vars['base_url'].get()
-            self.current_agent_config.api_config.model_name = self.config_vars['model_name'].get()
-            self.current_agent_config.api_config.temperature = self.config_vars['temperature'].get()
-            self.current_agent_config.api_config.max_tokens = self.config_vars['max_tokens'].get()
-            self.current_agent_config.api_config.timeout = self.config_vars['timeout'].get()
-            self.current_agent_config.api_config.retry_times = self.config_vars['retry_times'].get()
-            self.current_agent_config.api_config.proxy = self.config_vars['proxy'].get()
-            self.current_agent_config.api_config.verify_ssl = self.config_vars['verify_ssl'].get()
+            api_config = self.current_agent_config.api_config
+
+            # 只收集与当前配置不同的API字段
+            changes = {}
+            for attr in self._AGENT_API_FIELDS:
+                value = self.config_vars[attr].get()
+                if getattr(api_config, attr) != value:
+                    changes[attr] = value
 
             # 更新提示词配置
+            prompt_config = self.current_agent_config.prompt_config
             if 'prompt_config_name' in self.config_vars:
                 prompt_name = self.config_vars['prompt_config_name'].get()
                 if prompt_name:
                     # 获取选中的提示词配置
                     prompt_configs = agent_config_manager.get_all_prompt_configs()
                     if prompt_name in prompt_configs:
-                        self.current_agent_config.prompt_config = prompt_configs[prompt_name]
+                        prompt_config = prompt_configs[prompt_name]
+
+            # 没有任何变化时不写入文件
+            if not changes and prompt_config is self.current_agent_config.prompt_config:
+                return False
+
+            for attr, value in changes.items():
+                setattr(api_config, attr, value)
+            self.current_agent_config.prompt_config = prompt_config
 
             # 保存配置
             agent_config_manager.update_config(
@@ -1334,9 +1415,11 @@ class FilterConfigDialog:
 
             # 设置为当前配置
             agent_config_manager.set_current_config(self.current_agent_config.config_name)
+            return True
 
         except Exception as e:
             print(f"保存AI Agent配置失败: {e}")
+            return False
 
 
 class PromptConfigDialog:
@@ -1392,14 +1475,19 @@ class PromptConfigDialog:
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
 
-        # 系统提示词标签页
-        self.create_system_prompt_tab(notebook)
-
-        # 评估提示词标签页
-        self.create_evaluation_prompt_tab(notebook)
-
-        # 批量评估提示词标签页
-        self.create_batch_prompt_tab(notebook)
+        # 各标签页的编辑区域在首次显示时才创建，未打开的标签页保存时沿用原内容
+        self.system_prompt_text = None
+        self.eval_prompt_text = None
+        self.batch_prompt_text = None
+        self._tab_builders = {}
+        for text, builder in (("系统提示词", self.create_system_prompt_tab),
+                              ("评估提示词", self.create_evaluation_prompt_tab),
+                              ("批量评估提示词", self.create_batch_prompt_tab)):
+            page = ttk.Frame(notebook)
+            notebook.add(page, text=text)
+            self._tab_builders[str(page)] = (builder, page)
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self._build_tab(notebook.select()))
+        self._build_tab(notebook.select())
 
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
@@ -1408,77 +1496,61 @@ class PromptConfigDialog:
         ttk.Button(button_frame, text="取消", command=self.cancel).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="保存", command=self.save).pack(side=tk.RIGHT)
 
-    def create_system_prompt_tab(self, notebook):
-        """创建系统提示词标签页"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="系统提示词")
+    def _build_tab(self, tab_id):
+        """首次显示标签页时创建其内容"""
+        entry = self._tab_builders.pop(str(tab_id), None)
+        if entry is not None:
+            builder, page = entry
+            builder(page)
 
+    def _create_prompt_text(self, frame, hint: str, content: str) -> tk.Text:
+        """创建带说明和滚动条的提示词编辑区域"""
         # 说明
-        ttk.Label(frame, text="系统提示词定义AI的角色和基本行为规范:",
-                 font=("Arial", 10, "bold")).pack(anchor=tk.W, padx=5, pady=5)
+        ttk.Label(frame, text=hint, font=("Arial", 10, "bold")).pack(anchor=tk.W, padx=5, pady=5)
 
         # 文本编辑区域
         text_frame = ttk.Frame(frame)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        self.system_prompt_text = tk.Text(text_frame, wrap=tk.WORD, height=15, width=60)
-        system_scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.system_prompt_text.yview)
-        self.system_prompt_text.configure(yscrollcommand=system_scrollbar.set)
-
-        self.system_prompt_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        system_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # 插入现有内容
-        self.system_prompt_text.insert("1.0", self.prompt_config.system_prompt)
+        text_widget = tk.Text(text_frame, wrap=tk.WORD, height=15, width=60)
+        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
 
-    def create_evaluation_prompt_tab(self, notebook):
-        """创建评估提示词标签页"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="评估提示词")
-
-        # 说明
-        ttk.Label(frame, text="评估提示词用于单篇文章的评估，支持变量: {title}, {summary}, {content_preview}",
-                 font=("Arial", 10, "bold")).pack(anchor=tk.W, padx=5, pady=5)
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # 文本编辑区域
-        text_frame = ttk.Frame(frame)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # 一次插入现有内容，并清除修改标记，初始内容不算用户编辑
+        text_widget.insert("1.0", content)
+        text_widget.edit_modified(False)
+        return text_widget
 
-        self.eval_prompt_text = tk.Text(text_frame, wrap=tk.WORD, height=15, width=60)
-        eval_scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.eval_prompt_text.yview)
-        self.eval_prompt_text.configure(yscrollcommand=eval_scrollbar.set)
-
-        self.eval_prompt_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        eval_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    def create_system_prompt_tab(self, frame):
+        """创建系统提示词标签页"""
+        self.system_prompt_text = self._create_prompt_text(
+            frame, "系统提示词定义AI的角色和基本行为规范:", self.prompt_config.system_prompt)
 
-        # 插入现有内容
-        self.eval_prompt_text.insert("1.0", self.prompt_config.evaluation_prompt)
+    def create_evaluation_prompt_tab(self, frame):
+        """创建评估提示词标签页"""
+        self.eval_prompt_text = self._create_prompt_text(
+            frame, "评估提示词用于单篇文章的评估，支持变量: {title}, {summary}, {content_preview}",
+            self.prompt_config.evaluation_prompt)
 
-    def create_batch_prompt_tab(self, notebook):
+    def create_batch_prompt_tab(self, frame):
         """创建批量评估提示词标签页"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="批量评估提示词")
-
-        # 说明
-        ttk.Label(frame, text="批量评估提示词用于多篇文章的批量评估，支持变量: {articles_json}",
-                 font=("Arial", 10, "bold")).pack(anchor=tk.W, padx=5, pady=5)
-
-        # 文本编辑区域
-        text_frame = ttk.Frame(frame)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        self.batch_prompt_text = tk.Text(text_frame, wrap=tk.WORD, height=15, width=60)
-        batch_scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.batch_prompt_text.yview)
-        self.batch_prompt_text.configure(yscrollcommand=batch_scrollbar.set)
-
-        self.batch_prompt_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        batch_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.batch_prompt_text = self._create_prompt_text(
+            frame, "批量评估提示词用于多篇文章的批量评估，支持变量: {articles_json}",
+            self.prompt_config.batch_evaluation_prompt)
 
-        # 插入现有内容
-        self.batch_prompt_text.insert("1.0", self.prompt_config.batch_evaluation_prompt)
+    @staticmethod
+    def _prompt_value(text_widget, original: str) -> str:
+        """读取提示词编辑区域的内容，标签页未打开过或内容未被编辑时直接返回原内容"""
+        if text_widget is None or not text_widget.edit_modified():
+            return original
+        return text_widget.get("1.0", "end-1c").strip()
 
     def save(self):
         """保存提示词配置"""
+        from ..config.agent_config import AgentPromptConfig
         name = self.name_var.get().strip()
         if not name:
             messagebox.showerror("错误", "请输入配置名称", parent=self.dialog)
@@ -1488,9 +1560,10 @@ class PromptConfigDialog:
         new_config = AgentPromptConfig(
             name=name,
             description=self.desc_var.get().strip(),
-            system_prompt=self.system_prompt_text.get("1.0", tk.END).strip(),
-            evaluation_prompt=self.eval_prompt_text.get("1.0", tk.END).strip(),
-            batch_evaluation_prompt=self.batch_prompt_text.get("1.0", tk.END).strip(),
+            system_prompt=self._prompt_value(self.system_prompt_text, self.prompt_config.system_prompt),
+            evaluation_prompt=self._prompt_value(self.eval_prompt_text, self.prompt_config.evaluation_prompt),
+            batch_evaluation_prompt=self._prompt_value(self.batch_prompt_text,
+                                                       self.prompt_config.batch_evaluation_prompt),
             version="1.0"
         )
 
@@ -1,12 +1,31 @@
 """
 统一筛选对话框
 """
+import logging
 import tkinter as tk
+from collections import namedtuple
 from tkinter import ttk, messagebox
 
+logger = logging.getLogger(__name__)
+
+# 单个订阅源筛选时传给主窗口的订阅源信息，兼容现有的subscription接口
+_Subscription = namedtuple("_Subscription", ["id", "title"])
+
 class FilterDialog:
     """统一筛选对话框"""
 
+    # 界面字体
+    TITLE_FONT = ("", 14, "bold")
+    INFO_FONT = ("", 9)
+    NOTE_FONT = ("TkDefaultFont", 8)
+
+    # 筛选类型选项：(显示文字, 值)
+    FILTER_TYPES = (
+        ("关键词筛选", "keyword"),
+        ("智能筛选", "ai"),
+        ("综合筛选（推荐）", "chain"),
+    )
+
     def __init__(self, parent, main_window=None):
         self.parent = parent  # tkinter根窗口
         self.main_window = main_window  # 主窗口对象
@@ -17,6 +36,7 @@ class FilterDialog:
         self.filter_mode_var = tk.StringVar(value="batch")  # "batch" 或 "single"
         self.filter_type_var = tk.StringVar(value="chain")
         self.selected_subscription_var = tk.StringVar()
+        self._info_text = ""  # 当前选中订阅源的提示文字，显示对话框前生成
 
         # 获取订阅源列表
         self.subscriptions = self._get_subscriptions()
@@ -27,8 +47,20 @@ class FilterDialog:
             return self.main_window.current_subscriptions
         return []
 
+    def _selected_feed_text(self):
+        """生成当前选中RSS订阅源的提示文字"""
+        if (self.main_window and hasattr(self.main_window, 'rss_manager') and
+            self.main_window.rss_manager and self.main_window.rss_manager.selected_feed):
+            selected_title = self.main_window.rss_manager.selected_feed.title
+            if len(selected_title) > 40:
+                selected_title = selected_title[:37] + "..."
+            return f"当前选中: {selected_title}"
+        return "当前未选中任何RSS订阅源"
+
     def show(self):
         """显示对话框并返回筛选配置"""
+        # 选中的订阅源可能在两次显示之间变化，每次显示前生成一次提示文字
+        self._info_text = self._selected_feed_text()
         self.create_dialog()
         self.dialog.wait_window()
         return self.result
@@ -65,7 +97,7 @@ class FilterDialog:
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # 标题
-        title_label = ttk.Label(main_frame, text="智能筛选", font=("", 14, "bold"))
+        title_label = ttk.Label(main_frame, text="智能筛选", font=self.TITLE_FONT)
         title_label.pack(pady=(0, 20))
 
         # 筛选模式选择
@@ -78,28 +110,16 @@ class FilterDialog:
                        value="single").pack(anchor=tk.W, pady=(10, 0))
 
         # 显示当前选中的RSS订阅源
-        if (self.main_window and hasattr(self.main_window, 'rss_manager') and
-            self.main_window.rss_manager and self.main_window.rss_manager.selected_feed):
-            selected_title = self.main_window.rss_manager.selected_feed.title
-            if len(selected_title) > 40:
-                selected_title = selected_title[:37] + "..."
-            info_text = f"当前选中: {selected_title}"
-        else:
-            info_text = "当前未选中任何RSS订阅源"
-
-        info_label = ttk.Label(mode_frame, text=info_text, foreground="gray", font=("", 9))
+        info_label = ttk.Label(mode_frame, text=self._info_text, foreground="gray", font=self.INFO_FONT)
         info_label.pack(anchor=tk.W, pady=(5, 0))
 
         # 筛选类型选择
         filter_frame = ttk.LabelFrame(main_frame, text="筛选类型", padding="10")
         filter_frame.pack(fill=tk.X, pady=(0, 15))
 
-        ttk.Radiobutton(filter_frame, text="关键词筛选",
-                       variable=self.filter_type_var, value="keyword").pack(anchor=tk.W)
-        ttk.Radiobutton(filter_frame, text="智能筛选",
-                       variable=self.filter_type_var, value="ai").pack(anchor=tk.W)
-        ttk.Radiobutton(filter_frame, text="综合筛选（推荐）",
-                       variable=self.filter_type_var, value="chain").pack(anchor=tk.W)
+        for text, value in self.FILTER_TYPES:
+            ttk.Radiobutton(filter_frame, text=text,
+                           variable=self.filter_type_var, value=value).pack(anchor=tk.W)
 
         # 测试模式设置
         test_frame = ttk.LabelFrame(main_frame, text="测试模式", padding="10")
@@ -115,7 +135,7 @@ class FilterDialog:
         # 测试模式说明
         test_info_label = ttk.Label(test_frame, 
                                    text="测试模式下将使用模拟数据进行筛选，不会消耗API配额", 
-                                   foreground="gray", font=("TkDefaultFont", 8))
+                                   foreground="gray", font=self.NOTE_FONT)
         test_info_label.pack(anchor=tk.W, pady=(5, 0))
 
         # 按钮框架
@@ -132,13 +152,13 @@ class FilterDialog:
         ttk.Button(button_frame, text="确定",
                   command=self.start_filter).pack(side=tk.RIGHT, padx=(0, 10))
 
-        print("筛选对话框按钮已创建")  # 调试信息
+        logger.debug("筛选对话框按钮已创建")
     
     def show_config(self):
         """显示筛选配置"""
         try:
             from .filter_config_dialog import FilterConfigDialog
-            config_dialog = FilterConfigDialog(self.dialog)
+            config_dialog = FilterConfigDialog.show(self.dialog)
             if config_dialog.result:
                 messagebox.showinfo("提示", "配置已更新，下次筛选时生效")
         except Exception as e:
@@ -146,7 +166,7 @@ class FilterDialog:
 
     def start_filter(self):
         """开始筛选"""
-        print("确定按钮被点击")  # 调试信息
+        logger.debug("确定按钮被点击")
         mode = self.filter_mode_var.get()
         filter_type = self.filter_type_var.get()
         test_mode = self.test_mode_var.get()
@@ -161,22 +181,17 @@ class FilterDialog:
         if mode == "single":
             if (self.main_window and hasattr(self.main_window, 'rss_manager') and
                 self.main_window.rss_manager and self.main_window.rss_manager.selected_feed):
-                # 创建一个模拟的subscription对象，用于兼容现有接口
                 rss_feed = self.main_window.rss_manager.selected_feed
-                subscription = type('Subscription', (), {
-                    'id': f"rss_{rss_feed.id}",
-                    'title': rss_feed.title
-                })()
-                self.result["subscription"] = subscription
+                self.result["subscription"] = _Subscription(id=f"rss_{rss_feed.id}", title=rss_feed.title)
             else:
                 messagebox.showwarning("警告", "请先在RSS管理器中选择要筛选的订阅源")
                 return
 
-        print(f"筛选配置: {self.result}")  # 调试信息
+        logger.debug("筛选配置: %s", self.result)
         self.dialog.destroy()
 
     def cancel(self):
         """取消"""
-        print("取消按钮被点击")  # 调试信息
+        logger.debug("取消按钮被点击")
         self.result = None
         self.dialog.destroy()
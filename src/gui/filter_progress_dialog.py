@@ -3,55 +3,106 @@
 """
 import tkinter as tk
 from tkinter import ttk
+import logging
+import queue
 import threading
+import time
+from collections import deque
+from datetime import datetime
 from ..services.filter_service import FilterService, CLIProgressCallback, get_filter_service
 
+logger = logging.getLogger(__name__)
+
+
+# 只读文本框中放行的光标移动键
+_READONLY_NAV_KEYS = ("Left", "Right", "Up", "Down", "Prior", "Next", "Home", "End")
+
+
+def _readonly_key(event):
+    """只读文本框的按键处理：只放行复制、全选和光标移动，拦截其余按键"""
+    if event.state & 0x4 and event.keysym.lower() in ("c", "a"):
+        return None
+    if event.keysym in _READONLY_NAV_KEYS:
+        return None
+    return "break"
+
+
+def _make_readonly(text: tk.Text):
+    """文本框保持可写状态，通过拦截编辑事件实现只读，程序写入内容时无需切换state"""
+    text.bind("<Key>", _readonly_key)
+    for sequence in ("<<Paste>>", "<<Cut>>", "<<PasteSelection>>"):
+        text.bind(sequence, lambda e: "break")
+
+
+def _truncate(title: str, limit: int) -> str:
+    """截断过长的标题用于显示"""
+    return title if len(title) <= limit else title[:limit] + "..."
+
 
 class FilterProgressCallback(CLIProgressCallback):
     """GUI筛选进度回调"""
 
+    # 逐篇进度回调最多每隔多少秒更新一次界面（首篇和最后一篇总是更新）
+    PROGRESS_INTERVAL = 0.1
+
+    # 筛选类型的显示名称
+    FILTER_NAMES = {
+        "keyword": "关键词筛选",
+        "ai": "AI筛选",
+        "chain": "综合筛选"
+    }
+
+    # 评分标记，按 (评分>=15) + (评分>=20) 取用
+    SCORE_EMOJI = ("🔴", "🟡", "🟢")
+
     def __init__(self, dialog, filter_type="chain"):
         super().__init__(show_progress=False)
         self.dialog = dialog
         self.filter_type = filter_type
+        self._filter_name = self.FILTER_NAMES.get(filter_type, "筛选")
         self.current_article_title = ""
-        self.ai_start_time = None
+        self.ai_start_time = None  # AI筛选开始时间（time.monotonic）
+        self._last_progress_time = 0.0  # 上次报告进度的时间（time.monotonic）
+
+        # 各阶段在总进度中的占比和起点：单独筛选时占90%（留10%给完成处理），
+        # 综合筛选时关键词占0~50%，AI占50~90%
+        self._keyword_scale = 90 if filter_type == "keyword" else 50
+        self._keyword_done = 95 if filter_type == "keyword" else 50  # 关键词筛选完成时的进度
+        if filter_type == "ai":
+            self._ai_scale, self._ai_offset = 90, 0
+        else:
+            self._ai_scale, self._ai_offset = 40, 50
 
     def on_start(self, total_articles: int):
         """筛选开始"""
         self.total_articles = total_articles
-        filter_names = {
-            "keyword": "关键词筛选",
-            "ai": "AI筛选",
-            "chain": "综合筛选"
-        }
-        filter_name = filter_names.get(self.filter_type, "筛选")
-        self.dialog.update_status(f"开始{filter_name} {total_articles} 篇文章...")
+        self.dialog.update_status(f"开始{self._filter_name} {total_articles} 篇文章...")
         self.dialog.set_progress(0, 100)
 
+    def _progress_due(self, processed: int, total: int) -> bool:
+        """进度回调限流：距上次报告不足PROGRESS_INTERVAL时跳过，阶段的开始和结束总是报告"""
+        now = time.monotonic()
+        if processed not in (0, total) and now - self._last_progress_time < self.PROGRESS_INTERVAL:
+            return False
+        self._last_progress_time = now
+        return True
+
     def on_keyword_progress(self, processed: int, total: int):
         """关键词筛选进度"""
-        if self.filter_type == "keyword":
-            # 关键词单独筛选时占100%
-            percentage = (processed / total) * 90  # 留10%给完成处理
-        else:
-            # 综合筛选时关键词占50%
-            percentage = (processed / total) * 50
+        if not self._progress_due(processed, total):
+            return
+        percentage = (processed / total) * self._keyword_scale
         self.dialog.update_status(f"关键词筛选进度: {processed}/{total}")
         self.dialog.set_progress(percentage, 100)
 
     def on_keyword_complete(self, results_count: int):
         """关键词筛选完成"""
         self.dialog.update_status(f"关键词筛选完成: {results_count} 篇文章通过")
-        if self.filter_type == "keyword":
-            self.dialog.set_progress(95, 100)
-        else:
-            self.dialog.set_progress(50, 100)
+        self.dialog.set_progress(self._keyword_done, 100)
 
     def on_ai_start(self, total_articles: int):
         """AI筛选开始"""
-        import time
-        self.ai_start_time = time.time()
+        self.ai_start_time = time.monotonic()
         self.dialog.update_status(f"🤖 开始AI智能评估 {total_articles} 篇文章...")
         self.dialog.add_detail_log(f"AI筛选启动，准备评估 {total_articles} 篇文章")
 
@@ -59,15 +110,15 @@ class FilterProgressCallback(CLIProgressCallback):
         """开始评估单篇文章"""
         self.current_article_title = article_title
         # 截断过长的标题
-        display_title = article_title[:50] + "..." if len(article_title) > 50 else article_title
+        display_title = _truncate(article_title, 50)
         self.dialog.update_status(f"🔍 正在评估 [{current}/{total}]: {display_title}")
         self.dialog.add_detail_log(f"开始评估第 {current} 篇: {article_title}")
 
     def on_ai_article_complete(self, article_title: str, evaluation_score: float, processing_time: float):
         """单篇文章评估完成"""
         # 截断过长的标题
-        display_title = article_title[:40] + "..." if len(article_title) > 40 else article_title
-        score_emoji = "🟢" if evaluation_score >= 20 else "🟡" if evaluation_score >= 15 else "🔴"
+        display_title = _truncate(article_title, 40)
+        score_emoji = self.SCORE_EMOJI[(evaluation_score >= 15) + (evaluation_score >= 20)]
         self.dialog.add_detail_log(f"✅ {display_title} - 评分: {evaluation_score:.1f}/30 {score_emoji} ({processing_time:.1f}s)")
 
     def on_ai_batch_start(self, batch_size: int, batch_number: int, total_batches: int):
@@ -80,20 +131,15 @@ class FilterProgressCallback(CLIProgressCallback):
 
     def on_ai_progress(self, processed: int, total: int):
         """AI筛选进度"""
-        if self.filter_type == "ai":
-            # AI单独筛选时占100%
-            percentage = (processed / total) * 90  # 留10%给完成处理
-        else:
-            # 综合筛选时AI占40%
-            percentage = 50 + (processed / total) * 40
+        if not self._progress_due(processed, total):
+            return
+        fraction = processed / total
+        percentage = self._ai_offset + fraction * self._ai_scale
 
-        # 计算预估剩余时间
+        # 计算预估剩余时间（复用限流检查时读取的时间）
         if self.ai_start_time and processed > 0:
-            import time
-            elapsed = time.time() - self.ai_start_time
-            avg_time_per_article = elapsed / processed
-            remaining_articles = total - processed
-            estimated_remaining = avg_time_per_article * remaining_articles
+            elapsed = self._last_progress_time - self.ai_start_time
+            estimated_remaining = elapsed * (total - processed) / processed
 
             if estimated_remaining > 60:
                 time_str = f"预计剩余 {estimated_remaining/60:.1f} 分钟"
@@ -102,7 +148,7 @@ class FilterProgressCallback(CLIProgressCallback):
         else:
             time_str = ""
 
-        status_msg = f"🤖 AI筛选进度: {processed}/{total} ({(processed/total)*100:.1f}%)"
+        status_msg = f"🤖 AI筛选进度: {processed}/{total} ({fraction:.1%})"
         if time_str:
             status_msg += f" - {time_str}"
 
@@ -120,8 +166,12 @@ class FilterProgressCallback(CLIProgressCallback):
 
     def on_all_ai_results(self, all_results):
         """处理所有AI评估结果，更新界面显示"""
+        # 主窗口的界面同样只能在主线程中更新
+        self.dialog.run_in_ui(self._update_ai_scores, all_results)
+
+    def _update_ai_scores(self, all_results):
+        """在主线程中通知主窗口更新所有文章的AI得分"""
         try:
-            # 通知主窗口更新所有文章的AI得分
             if hasattr(self.dialog, 'main_window') and self.dialog.main_window:
                 self.dialog.main_window.update_all_articles_ai_scores(all_results)
                 self.dialog.add_detail_log(f"📊 已更新 {len(all_results)} 篇文章的AI得分显示")
@@ -131,8 +181,7 @@ class FilterProgressCallback(CLIProgressCallback):
     def on_ai_complete(self, results_count: int):
         """AI筛选完成"""
         if self.ai_start_time:
-            import time
-            total_time = time.time() - self.ai_start_time
+            total_time = time.monotonic() - self.ai_start_time
             time_str = f"耗时 {total_time:.1f} 秒"
         else:
             time_str = ""
@@ -151,35 +200,35 @@ class FilterProgressCallback(CLIProgressCallback):
 
     def on_ai_error(self, article_title: str, error: str):
         """AI评估错误"""
-        display_title = article_title[:40] + "..." if len(article_title) > 40 else article_title
+        display_title = _truncate(article_title, 40)
         self.dialog.add_detail_log(f"❌ {display_title} - 评估失败: {error}")
 
     def on_ai_fallback(self, article_title: str, reason: str):
         """AI降级处理"""
-        display_title = article_title[:40] + "..." if len(article_title) > 40 else article_title
+        display_title = _truncate(article_title, 40)
         self.dialog.add_detail_log(f"⚠️ {display_title} - 使用降级评估: {reason}")
 
     def on_complete(self, final_count: int):
         """筛选完成"""
-        filter_names = {
-            "keyword": "关键词筛选",
-            "ai": "AI筛选",
-            "chain": "综合筛选"
-        }
-        filter_name = filter_names.get(self.filter_type, "筛选")
-        self.dialog.update_status(f"🎉 {filter_name}完成: 最终选出 {final_count} 篇文章")
+        self.dialog.update_status(f"🎉 {self._filter_name}完成: 最终选出 {final_count} 篇文章")
         self.dialog.set_progress(100, 100)
-        self.dialog.on_complete()
+        self.dialog.run_in_ui(self.dialog.on_complete)
 
     def on_error(self, error: str):
         """筛选错误"""
         self.dialog.update_status(f"❌ 筛选错误: {error}")
         self.dialog.add_detail_log(f"❌ 筛选过程发生错误: {error}")
-        self.dialog.on_error(error)
+        self.dialog.run_in_ui(self.dialog.on_error, error)
 
 
 class FilterProgressDialog:
     """筛选进度对话框"""
+
+    # 每隔多少毫秒在主线程中处理一次筛选线程发来的界面更新（筛选回调频率远高于此）
+    EVENT_POLL_INTERVAL = 50
+    # 最多保留的详细日志条数，超出后丢弃最早的日志
+    DETAIL_LOG_LIMIT = 5000
+    # 只读日志框中仍允许的光标移动按键
     
     def __init__(self, parent, articles, filter_type="chain", main_window=None, test_mode=False):
         self.parent = parent
@@ -191,7 +240,13 @@ class FilterProgressDialog:
         self.cancelled = False
         self.completed = False  # 新增：标记筛选是否正常完成
         self.filter_thread = None
-        self.detail_logs = []  # 详细日志列表
+        self.cancel_event = threading.Event()  # 通知筛选服务停止逐篇筛选
+        self.detail_logs = deque(maxlen=self.DETAIL_LOG_LIMIT)  # 详细日志，元素为 (时间戳, 消息)，显示时才格式化
+        # 筛选线程不直接操作Tk组件，而是把更新放入队列，由主线程定时取出显示
+        self._events = queue.Queue()
+        self._drain_after_id = None
+        self._shown_status = None  # 界面上当前显示的状态信息
+        self._shown_progress = None  # 界面上当前显示的进度百分比文字
 
         # 创建对话框
         self.dialog = tk.Toplevel(parent)
@@ -205,7 +260,8 @@ class FilterProgressDialog:
         self.create_widgets()
         self.center_window()
 
-        # 开始筛选
+        # 开始处理界面更新并开始筛选
+        self._drain_after_id = self.dialog.after(self.EVENT_POLL_INTERVAL, self._drain_events)
         self.start_filtering()
 
         # 等待对话框关闭
@@ -271,8 +327,9 @@ class FilterProgressDialog:
         log_container.pack(fill=tk.BOTH, expand=True)
 
         self.log_text = tk.Text(log_container, height=12, wrap=tk.WORD,
-                               font=("Consolas", 9), state=tk.DISABLED,
+                               font=("Consolas", 9),
                                bg="#f8f9fa", fg="#333333")
+        _make_readonly(self.log_text)
 
         log_scrollbar = ttk.Scrollbar(log_container, orient=tk.VERTICAL,
                                      command=self.log_text.yview)
@@ -306,50 +363,108 @@ class FilterProgressDialog:
         self.close_button.pack(side=tk.LEFT)
     
     def update_status(self, message: str):
-        """更新状态信息"""
+        """更新状态信息（可在任意线程调用）"""
         if not self.cancelled:
-            self.status_label.config(text=message)
-            self.dialog.update_idletasks()
+            self._events.put(("status", message))
 
     def set_progress(self, value: float, maximum: float = 100):
-        """设置进度"""
+        """设置进度（可在任意线程调用）"""
         if not self.cancelled:
-            self.progress_var.set(value)
-            percentage = (value / maximum) * 100
-            self.progress_label.config(text=f"{percentage:.1f}%")
-            self.dialog.update_idletasks()
+            self._events.put(("progress", (value, maximum)))
 
     def add_detail_log(self, message: str):
-        """添加详细日志"""
+        """添加详细日志（可在任意线程调用）"""
         if not self.cancelled:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            log_entry = f"[{timestamp}] {message}"
-            self.detail_logs.append(log_entry)
+            self._events.put(("log", (time.time(), message)))
+
+    def run_in_ui(self, func, *args):
+        """在主线程中按顺序执行func(*args)（可在任意线程调用）"""
+        self._events.put(("call", (func, args)))
 
-            # 更新日志显示
+    def _drain_events(self):
+        """在主线程中取出队列中的全部更新，状态和进度只显示最新的一条"""
+        self._drain_after_id = None
+        if not self.dialog.winfo_exists():
+            return
+
+        # 在取队列之前判断：筛选线程已结束时，这次取完后不会再有新的更新
+        worker_done = self.filter_thread is not None and not self.filter_thread.is_alive()
+
+        status = progress = None
+        logs = []
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "status":
+                status = payload
+            elif kind == "progress":
+                progress = payload
+            elif kind == "log":
+                logs.append(payload)
+            else:
+                # 先显示此前的更新，再执行回调，保持与筛选线程中的顺序一致
+                self._apply_updates(status, progress, logs)
+                status = progress = None
+                logs = []
+                func, args = payload
+                func(*args)
+        self._apply_updates(status, progress, logs)
+
+        # 筛选线程结束（包括出错）或用户取消后不再轮询，对话框空闲时不占用CPU。
+        # 不能以completed为准：on_complete排队后筛选线程还会排队_set_result
+        if not (self.cancelled or worker_done) and self.dialog.winfo_exists():
+            self._drain_after_id = self.dialog.after(self.EVENT_POLL_INTERVAL, self._drain_events)
+
+    def _apply_updates(self, status, progress, logs):
+        """把一批更新写入界面"""
+        # 与当前显示相同的内容不重新设置
+        if status is not None and status != self._shown_status:
+            self.status_label.config(text=status)
+            self._shown_status = status
+        if progress is not None:
+            # 以显示的百分比（0.1%精度）判断是否变化，小于一个像素的移动不重绘进度条
+            value, maximum = progress
+            percentage = (value / maximum) * 100
+            shown = f"{percentage:.1f}%"
+            if shown != self._shown_progress:
+                self.progress_var.set(value)
+                self.progress_label.config(text=shown)
+                self._shown_progress = shown
+        if logs:
+            self.detail_logs.extend(logs)
+
+            # 更新日志显示；隐藏时不格式化
             if self.show_details_var.get():
-                self.log_text.config(state=tk.NORMAL)
-                self.log_text.insert(tk.END, log_entry + "\n")
+                self.log_text.insert(tk.END, "\n".join(map(self._format_log, logs)) + "\n")
+                self._trim_log_text()
                 self.log_text.see(tk.END)  # 自动滚动到底部
-                self.log_text.config(state=tk.DISABLED)
-                self.dialog.update_idletasks()
+
+    def _trim_log_text(self):
+        """删除日志框开头多出的行，使显示的行数与detail_logs一样不超过DETAIL_LOG_LIMIT"""
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - self.DETAIL_LOG_LIMIT
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+
+    @staticmethod
+    def _format_log(entry):
+        """把 (时间戳, 消息) 格式化为显示的日志行"""
+        timestamp, message = entry
+        return f"[{datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')}] {message}"
 
     def toggle_details(self):
         """切换详细日志显示"""
         if self.show_details_var.get():
             # 显示所有日志
-            self.log_text.config(state=tk.NORMAL)
             self.log_text.delete(1.0, tk.END)
-            for log_entry in self.detail_logs:
-                self.log_text.insert(tk.END, log_entry + "\n")
+            if self.detail_logs:
+                self.log_text.insert(tk.END, "\n".join(map(self._format_log, self.detail_logs)) + "\n")
             self.log_text.see(tk.END)
-            self.log_text.config(state=tk.DISABLED)
         else:
             # 清空日志显示
-            self.log_text.config(state=tk.NORMAL)
             self.log_text.delete(1.0, tk.END)
-            self.log_text.config(state=tk.DISABLED)
+
     
     def start_filtering(self):
         """开始筛选"""
@@ -363,30 +478,33 @@ class FilterProgressDialog:
                     articles=self.articles,
                     filter_type=self.filter_type,
                     callback=callback,
-                    test_mode=self.test_mode
+                    test_mode=self.test_mode,
+                    cancel_event=self.cancel_event
                 )
 
                 # 确保在主线程中设置结果
                 if not self.cancelled:
-                    self.dialog.after(0, lambda: self._set_result(result))
+                    self.run_in_ui(self._set_result, result)
 
             except Exception as e:
                 if not self.cancelled:
-                    self.dialog.after(0, lambda: self.on_error(str(e)))
+                    self.run_in_ui(self.on_error, str(e))
         
-        self.filter_thread = threading.Thread(target=filter_task, daemon=True)
+        # 使用守护线程而不是线程池：线程池的工作线程在程序退出时会被等待，
+        # 正在进行的AI筛选可能持续数分钟，会导致关闭主窗口后程序迟迟不退出
+        self.filter_thread = threading.Thread(target=filter_task, name="filter-task", daemon=True)
         self.filter_thread.start()
 
     def _set_result(self, result):
         """在主线程中设置筛选结果"""
         self.result = result
-        print(f"筛选结果已设置: {result.final_selected_count if result else 0} 篇文章")
+        logger.debug("筛选结果已设置: %d 篇文章", result.final_selected_count if result else 0)
         # 设置结果后调用完成处理
         self.on_complete()
 
     def on_complete(self):
         """筛选完成"""
-        print(f"🔄 FilterProgressDialog.on_complete() 被调用")
+        logger.debug("FilterProgressDialog.on_complete() 被调用")
         self.completed = True  # 标记为正常完成
         self.cancel_button.config(state=tk.DISABLED)
         self.close_button.config(state=tk.NORMAL)
@@ -406,23 +524,25 @@ class FilterProgressDialog:
     def cancel(self):
         """取消筛选"""
         self.cancelled = True
+        self.cancel_event.set()
         self.update_status("正在取消筛选...")
         self.cancel_button.config(state=tk.DISABLED)
         self.close_button.config(state=tk.NORMAL)
         
-        # 注意：实际的筛选线程可能无法立即停止
-        # 这里只是标记取消状态，避免更新UI
+        # 筛选线程在处理完当前文章后停止，不再发起新的AI请求
     
     def close(self):
         """关闭对话框"""
-        print(f"🔄 FilterProgressDialog.close() 被调用")
-        print(f"   completed: {self.completed}, result: {self.result is not None}")
+        logger.debug("FilterProgressDialog.close() 被调用: completed=%s, result=%s",
+                     self.completed, self.result is not None)
         # 只有在没有正常完成且没有结果的情况下才标记为取消
         if not self.completed and self.result is None:
-            print(f"   设置 cancelled = True")
             self.cancelled = True
-        else:
-            print(f"   保持 cancelled = {self.cancelled}")
+            self.cancel_event.set()
+        logger.debug("cancelled = %s", self.cancelled)
+        if self._drain_after_id is not None:
+            self.dialog.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
         self.dialog.destroy()
 
 
@@ -474,6 +594,7 @@ class FilterMetricsDialog:
         
         # 创建文本框显示指标
         self.metrics_text = tk.Text(main_frame, wrap=tk.WORD, height=15, width=60)
+        _make_readonly(self.metrics_text)
         
         # 滚动条
         scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.metrics_text.yview)
@@ -497,44 +618,43 @@ class FilterMetricsDialog:
             
             
             metrics = get_filter_service().get_metrics()
-            
-            # 清空文本框
-            self.metrics_text.delete(1.0, tk.END)
-            
-            # 显示指标
-            self.metrics_text.insert(tk.END, "筛选性能指标报告\n")
-            self.metrics_text.insert(tk.END, "=" * 50 + "\n\n")
-            
+
+            # 先拼接完整报告，再一次性插入文本框
+            parts = ["筛选性能指标报告\n", "=" * 50 + "\n\n"]
+
             for filter_type, filter_metrics in metrics.items():
+                name = filter_type.upper()
                 if filter_metrics.get('status') == 'no_data':
-                    self.metrics_text.insert(tk.END, f"{filter_type.upper()} 筛选器: 暂无数据\n\n")
+                    parts.append(f"{name} 筛选器: 暂无数据\n\n")
                     continue
-                
-                self.metrics_text.insert(tk.END, f"{filter_type.upper()} 筛选器:\n")
-                self.metrics_text.insert(tk.END, "-" * 30 + "\n")
-                
+
+                parts.append(f"{name} 筛选器:\n")
+                parts.append("-" * 30 + "\n")
+
                 if 'avg_processing_time' in filter_metrics:
-                    self.metrics_text.insert(tk.END, f"平均处理时间: {filter_metrics['avg_processing_time']:.2f}ms\n")
-                    self.metrics_text.insert(tk.END, f"中位数处理时间: {filter_metrics.get('median_processing_time', 0):.2f}ms\n")
-                    self.metrics_text.insert(tk.END, f"最大处理时间: {filter_metrics['max_processing_time']:.2f}ms\n")
-                    self.metrics_text.insert(tk.END, f"最小处理时间: {filter_metrics['min_processing_time']:.2f}ms\n")
-                    self.metrics_text.insert(tk.END, f"处理文章总数: {filter_metrics['total_processed']}\n")
-                    self.metrics_text.insert(tk.END, f"错误率: {filter_metrics['error_rate']:.2%}\n")
-                
+                    parts.append(f"平均处理时间: {filter_metrics['avg_processing_time']:.2f}ms\n")
+                    parts.append(f"中位数处理时间: {filter_metrics.get('median_processing_time', 0):.2f}ms\n")
+                    parts.append(f"最大处理时间: {filter_metrics['max_processing_time']:.2f}ms\n")
+                    parts.append(f"最小处理时间: {filter_metrics['min_processing_time']:.2f}ms\n")
+                    parts.append(f"处理文章总数: {filter_metrics['total_processed']}\n")
+                    parts.append(f"错误率: {filter_metrics['error_rate']:.2%}\n")
+
                 if 'cache_hit_rate' in filter_metrics:
-                    self.metrics_text.insert(tk.END, f"缓存命中率: {filter_metrics['cache_hit_rate']:.2%}\n")
-                    self.metrics_text.insert(tk.END, f"缓存大小: {filter_metrics.get('cache_size', 0)}\n")
-                    self.metrics_text.insert(tk.END, f"缓存命中次数: {filter_metrics.get('hits', 0)}\n")
-                    self.metrics_text.insert(tk.END, f"缓存未命中次数: {filter_metrics.get('misses', 0)}\n")
-                
-                self.metrics_text.insert(tk.END, "\n")
-            
-            # 移动到开头
-            self.metrics_text.see(1.0)
-            
+                    parts.append(f"缓存命中率: {filter_metrics['cache_hit_rate']:.2%}\n")
+                    parts.append(f"缓存大小: {filter_metrics.get('cache_size', 0)}\n")
+                    parts.append(f"缓存命中次数: {filter_metrics.get('hits', 0)}\n")
+                    parts.append(f"缓存未命中次数: {filter_metrics.get('misses', 0)}\n")
+
+                parts.append("\n")
+
+            report = "".join(parts)
         except Exception as e:
-            self.metrics_text.delete(1.0, tk.END)
-            self.metrics_text.insert(tk.END, f"加载指标失败: {e}")
+            report = f"加载指标失败: {e}"
+
+        self.metrics_text.replace(1.0, tk.END, report)
+
+        # 移动到开头
+        self.metrics_text.see(1.0)
     
     def reset_metrics(self):
         """重置性能指标"""
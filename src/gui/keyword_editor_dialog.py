@@ -3,9 +3,28 @@
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import json
+import bisect
+import functools
 from typing import Dict, List
 
+from ..utils.json_io import json_dumps, json_loads
+
+
+@functools.lru_cache(maxsize=None)
+def _default_keywords() -> Dict[str, tuple]:
+    """默认关键词，转换为 {category: (关键词, ...)} 格式，只转换一次"""
+    from ..config.default_keywords import INTERNATIONAL_TECH_KEYWORDS
+    # 转换格式：从 {category: {keywords: [...], weight: ...}} 到 {category: (...)}
+    return {
+        category: tuple(data.get("keywords", ()))
+        for category, data in INTERNATIONAL_TECH_KEYWORDS.items()
+    }
+
+
+def _parse_keywords(text: str) -> List[str]:
+    """把每行一个的关键词文本解析为列表，去掉首尾空白和空行"""
+    return [keyword for keyword in map(str.strip, text.splitlines()) if keyword]
+
 
 class KeywordEditorDialog:
     """关键词编辑器对话框"""
@@ -14,13 +33,14 @@ class KeywordEditorDialog:
         self.parent = parent
         self.keywords_data = keywords_data
         self.result = False
+        self._categories = []  # 与分类列表框内容一致的有序分类名列表
+        self._total_keywords = 0  # 所有分类的关键词总数，随修改增量维护
         
         # 如果没有关键词数据，加载默认的
         if not self.keywords_data:
-            from ..config.default_keywords import INTERNATIONAL_TECH_KEYWORDS
-            # 转换格式：从 {category: {keywords: [...], weight: ...}} 到 {category: [...]}
-            for category, data in INTERNATIONAL_TECH_KEYWORDS.items():
-                self.keywords_data[category] = data.get("keywords", [])
+            self.keywords_data.update(
+                (category, list(keywords)) for category, keywords in _default_keywords().items()
+            )
         
         # 创建对话框
         self.dialog = tk.Toplevel(parent)
@@ -145,18 +165,38 @@ class KeywordEditorDialog:
                   command=self.reset_to_default).pack(side=tk.LEFT)
     
     def load_keywords(self):
-        """加载关键词到界面"""
-        # 清空分类列表
+        """加载关键词到界面（整体刷新分类列表，用于初始化、导入和重置）"""
+        self._categories = sorted(self.keywords_data.keys())
+        self._total_keywords = sum(len(keywords) for keywords in self.keywords_data.values())
+
+        # 清空分类列表后一次性插入所有分类
         self.category_listbox.delete(0, tk.END)
-        
-        # 添加分类
-        for category in sorted(self.keywords_data.keys()):
-            self.category_listbox.insert(tk.END, category)
+        if self._categories:
+            self.category_listbox.insert(tk.END, *self._categories)
         
         # 选择第一个分类
-        if self.category_listbox.size() > 0:
+        if self._categories:
             self.category_listbox.selection_set(0)
-            self.on_category_select()
+        self.on_category_select()
+
+    def _set_category(self, category: str, keywords: List[str]):
+        """设置分类的关键词并同步关键词总数"""
+        self._total_keywords += len(keywords) - len(self.keywords_data.get(category, []))
+        self.keywords_data[category] = keywords
+
+    def _insert_category_sorted(self, category: str) -> int:
+        """按顺序插入一个分类，只改动列表框中对应的一行，返回插入位置"""
+        index = bisect.bisect_left(self._categories, category)
+        self._categories.insert(index, category)
+        self.category_listbox.insert(index, category)
+        return index
+
+    def _remove_category(self, category: str) -> int:
+        """删除一个分类，只改动列表框中对应的一行，返回其原位置"""
+        index = bisect.bisect_left(self._categories, category)
+        del self._categories[index]
+        self.category_listbox.delete(index)
+        return index
     
     def on_category_select(self, event=None):
         """分类选择事件"""
@@ -167,8 +207,7 @@ class KeywordEditorDialog:
             
             # 加载该分类的关键词
             keywords = self.keywords_data.get(category, [])
-            self.keywords_text.delete(1.0, tk.END)
-            self.keywords_text.insert(1.0, "\n".join(keywords))
+            self._set_keywords_text(keywords)
             
             # 更新统计信息
             self.update_stats(len(keywords))
@@ -177,12 +216,14 @@ class KeywordEditorDialog:
             self.keywords_text.delete(1.0, tk.END)
             self.update_stats(0)
     
+    def _set_keywords_text(self, keywords: List[str]):
+        """用一次替换操作把关键词写入文本框，避免先删除再插入造成两次重新布局"""
+        self.keywords_text.replace("1.0", tk.END, "\n".join(keywords))
+
     def update_stats(self, count: int):
         """更新统计信息"""
-        total_categories = len(self.keywords_data)
-        total_keywords = sum(len(keywords) for keywords in self.keywords_data.values())
-        
-        stats_text = f"当前分类: {count} 个关键词 | 总计: {total_categories} 个分类，{total_keywords} 个关键词"
+        stats_text = (f"当前分类: {count} 个关键词 | "
+                      f"总计: {len(self.keywords_data)} 个分类，{self._total_keywords} 个关键词")
         self.stats_label.config(text=stats_text)
     
     def add_category(self):
@@ -194,16 +235,14 @@ class KeywordEditorDialog:
                 messagebox.showwarning("警告", "分类已存在")
                 return
             
-            self.keywords_data[category_name] = []
-            self.load_keywords()
+            self._set_category(category_name, [])
+            index = self._insert_category_sorted(category_name)
             
             # 选择新添加的分类
-            for i in range(self.category_listbox.size()):
-                if self.category_listbox.get(i) == category_name:
-                    self.category_listbox.selection_clear(0, tk.END)
-                    self.category_listbox.selection_set(i)
-                    self.on_category_select()
-                    break
+            self.category_listbox.selection_clear(0, tk.END)
+            self.category_listbox.selection_set(index)
+            self.category_listbox.see(index)
+            self.on_category_select()
     
     def rename_category(self):
         """重命名分类"""
@@ -221,9 +260,14 @@ class KeywordEditorDialog:
                 messagebox.showwarning("警告", "分类名称已存在")
                 return
             
-            # 重命名
+            # 重命名：关键词内容不变，只移动列表中的一行并更新标题
             self.keywords_data[new_name] = self.keywords_data.pop(old_name)
-            self.load_keywords()
+            self._remove_category(old_name)
+            index = self._insert_category_sorted(new_name)
+            self.category_listbox.selection_clear(0, tk.END)
+            self.category_listbox.selection_set(index)
+            self.category_listbox.see(index)
+            self.current_category_label.config(text=f"当前分类: {new_name}")
     
     def delete_category(self):
         """删除分类"""
@@ -234,8 +278,15 @@ class KeywordEditorDialog:
         
         category = self.category_listbox.get(selection[0])
         if messagebox.askyesno("确认删除", f"确定要删除分类 '{category}' 吗？"):
-            del self.keywords_data[category]
-            self.load_keywords()
+            self._total_keywords -= len(self.keywords_data.pop(category))
+            index = self._remove_category(category)
+
+            # 选中原位置上的下一个分类
+            if self._categories:
+                index = min(index, len(self._categories) - 1)
+                self.category_listbox.selection_set(index)
+                self.category_listbox.see(index)
+            self.on_category_select()
     
     def save_keywords(self):
         """保存当前分类的关键词"""
@@ -245,11 +296,10 @@ class KeywordEditorDialog:
             return
         
         category = self.category_listbox.get(selection[0])
-        keywords_text = self.keywords_text.get(1.0, tk.END).strip()
         
         # 解析关键词
-        keywords = [kw.strip() for kw in keywords_text.split('\n') if kw.strip()]
-        self.keywords_data[category] = keywords
+        keywords = _parse_keywords(self.keywords_text.get("1.0", "end-1c"))
+        self._set_category(category, keywords)
         
         # 更新统计信息
         self.update_stats(len(keywords))
@@ -257,32 +307,26 @@ class KeywordEditorDialog:
     
     def sort_keywords(self):
         """排序关键词"""
-        keywords_text = self.keywords_text.get(1.0, tk.END).strip()
-        keywords = [kw.strip() for kw in keywords_text.split('\n') if kw.strip()]
+        keywords = _parse_keywords(self.keywords_text.get("1.0", "end-1c"))
         
         # 排序
         keywords.sort()
         
         # 更新文本
-        self.keywords_text.delete(1.0, tk.END)
-        self.keywords_text.insert(1.0, '\n'.join(keywords))
+        self._set_keywords_text(keywords)
     
     def deduplicate_keywords(self):
         """去重关键词"""
-        keywords_text = self.keywords_text.get(1.0, tk.END).strip()
-        keywords = [kw.strip() for kw in keywords_text.split('\n') if kw.strip()]
+        keywords = _parse_keywords(self.keywords_text.get("1.0", "end-1c"))
         
-        # 去重并保持顺序
-        seen = set()
-        unique_keywords = []
+        # 忽略大小写去重并保持顺序，保留每个关键词第一次出现的写法
+        unique_map = {}
         for kw in keywords:
-            if kw.lower() not in seen:
-                seen.add(kw.lower())
-                unique_keywords.append(kw)
+            unique_map.setdefault(kw.casefold(), kw)
+        unique_keywords = list(unique_map.values())
         
         # 更新文本
-        self.keywords_text.delete(1.0, tk.END)
-        self.keywords_text.insert(1.0, '\n'.join(unique_keywords))
+        self._set_keywords_text(unique_keywords)
         
         removed_count = len(keywords) - len(unique_keywords)
         if removed_count > 0:
@@ -305,8 +349,8 @@ class KeywordEditorDialog:
         if file_path:
             try:
                 if file_path.endswith('.json'):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        imported_data = json.load(f)
+                    with open(file_path, 'rb') as f:
+                        imported_data = json_loads(f.read())
                     
                     if isinstance(imported_data, dict):
                         self.keywords_data.update(imported_data)
@@ -319,7 +363,7 @@ class KeywordEditorDialog:
                     category_name = tk.simpledialog.askstring("分类名称", "请输入导入的分类名称:")
                     if category_name:
                         with open(file_path, 'r', encoding='utf-8') as f:
-                            keywords = [line.strip() for line in f if line.strip()]
+                            keywords = _parse_keywords(f.read())
                         
                         self.keywords_data[category_name] = keywords
                         self.load_keywords()
@@ -349,8 +393,8 @@ class KeywordEditorDialog:
         if file_path:
             try:
                 if file_path.endswith('.json'):
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump({category: keywords}, f, ensure_ascii=False, indent=2)
+                    with open(file_path, 'wb') as f:
+                        f.write(json_dumps({category: keywords}, indent=True))
                 else:
                     with open(file_path, 'w', encoding='utf-8') as f:
                         f.write('\n'.join(keywords))
@@ -362,11 +406,10 @@ class KeywordEditorDialog:
     def reset_to_default(self):
         """重置为默认关键词"""
         if messagebox.askyesno("确认重置", "确定要重置为默认关键词库吗？这将覆盖所有自定义关键词。"):
-            from ..config.default_keywords import INTERNATIONAL_TECH_KEYWORDS
             self.keywords_data.clear()
-            # 转换格式：从 {category: {keywords: [...], weight: ...}} 到 {category: [...]}
-            for category, data in INTERNATIONAL_TECH_KEYWORDS.items():
-                self.keywords_data[category] = data.get("keywords", [])
+            self.keywords_data.update(
+                (category, list(keywords)) for category, keywords in _default_keywords().items()
+            )
             self.load_keywords()
             messagebox.showinfo("成功", "已重置为默认关键词库")
     
@@ -3,6 +3,7 @@
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import logging
 import threading
 import webbrowser
 from typing import List, Optional
@@ -18,8 +19,14 @@ from ..services.preference_analysis_service import PreferenceAnalysisService
 # from .ai_analysis_dialog import AIAnalysisDialog  # 不再需要，改为直接在日志中显示
 
 
+logger = logging.getLogger(__name__)
+
+
 class MainWindow:
     """主窗口类"""
+
+    # 更新文章列表AI得分时每批处理的行数
+    AI_SCORE_UPDATE_CHUNK = 200
     
     def __init__(self):
         self.root = tk.Tk()
@@ -2230,57 +2237,54 @@ class MainWindow:
                     article_id = result.article.id
                     ai_scores_map[article_id] = result.evaluation
 
-            print(f"📊 准备更新 {len(ai_scores_map)} 篇文章的AI得分")
+            logger.debug("准备更新 %d 篇文章的AI得分", len(ai_scores_map))
 
             # 更新当前文章列表中的AI得分显示
             if hasattr(self, 'article_tree') and self.article_tree:
-                # 遍历树形控件中的所有项目
-                for item in self.article_tree.get_children():
-                    try:
-                        # 获取项目对应的文章
-                        item_index = self.article_tree.index(item)
-
-                        # 根据当前显示模式获取对应的文章列表
-                        if self.display_mode == "filtered" and self.filtered_articles:
-                            if item_index < len(self.filtered_articles):
-                                article = self.filtered_articles[item_index]
-                            else:
-                                continue
-                        else:
-                            if item_index < len(self.current_articles):
-                                article = self.current_articles[item_index]
-                            else:
-                                continue
-
-                        # 检查是否有AI评估结果
-                        if article.id in ai_scores_map:
-                            evaluation = ai_scores_map[article.id]
-                            ai_score_text = f"{evaluation.total_score}/30"
-
-                            # 获取当前项目的值
-                            current_values = list(self.article_tree.item(item, 'values'))
-
-                            # 更新AI得分列（第5列，索引为4）
-                            if len(current_values) > 4:
-                                current_values[4] = ai_score_text
-                            else:
-                                # 如果列数不够，扩展列表
-                                while len(current_values) <= 4:
-                                    current_values.append("")
-                                current_values[4] = ai_score_text
-
-                            self.article_tree.item(item, values=current_values)
+                # 根据当前显示模式获取对应的文章列表，树中项目的顺序与列表一致
+                if self.display_mode == "filtered" and self.filtered_articles:
+                    articles = self.filtered_articles
+                else:
+                    articles = self.current_articles
+                items = list(enumerate(self.article_tree.get_children()))
+                self._update_ai_scores_chunk(items, 0, articles, ai_scores_map)
 
-                    except Exception as e:
-                        print(f"⚠️ 更新单个文章AI得分失败: {e}")
-                        continue
+        except Exception:
+            logger.exception("更新AI得分时出错")
 
-            print(f"✅ AI得分更新完成")
+    def _update_ai_scores_chunk(self, items, start, articles, ai_scores_map):
+        """分批更新AI得分列，批次之间让主循环处理界面事件"""
+        end = start + self.AI_SCORE_UPDATE_CHUNK
+        for item_index, item in items[start:end]:
+            try:
+                # 项目可能已随列表刷新被删除
+                if item_index >= len(articles) or not self.article_tree.exists(item):
+                    continue
+                article = articles[item_index]
 
-        except Exception as e:
-            print(f"❌ 更新AI得分时出错: {e}")
-            import traceback
-            traceback.print_exc()
+                # 检查是否有AI评估结果
+                if article.id in ai_scores_map:
+                    evaluation = ai_scores_map[article.id]
+                    ai_score_text = f"{evaluation.total_score}/30"
+
+                    # 获取当前项目的值
+                    current_values = list(self.article_tree.item(item, 'values'))
+
+                    # 更新AI得分列（第5列，索引为4），列数不够时扩展列表
+                    while len(current_values) <= 4:
+                        current_values.append("")
+                    current_values[4] = ai_score_text
+
+                    self.article_tree.item(item, values=current_values)
+
+            except Exception as e:
+                logger.debug("更新单个文章AI得分失败: %s", e)
+                continue
+
+        if end < len(items):
+            self.root.after_idle(self._update_ai_scores_chunk, items, end, articles, ai_scores_map)
+        else:
+            logger.debug("AI得分更新完成")
 
     def show_filter_summary(self):
         """显示筛选结果摘要"""
@@ -2358,7 +2362,7 @@ AI筛选通过: {result.ai_filtered_count}
 
     def show_filter_config(self):
         """显示筛选配置对话框"""
-        config_dialog = FilterConfigDialog(self.root)
+        config_dialog = FilterConfigDialog.show(self.root)
         if config_dialog.result:
             messagebox.showinfo("提示", "配置已更新，下次筛选时生效")
 
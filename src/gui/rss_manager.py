@@ -61,7 +61,7 @@ class RSSManager:
         
         ttk.Label(search_frame, text="搜索:").pack(side=tk.LEFT, padx=(0, 5))
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self.on_search_change)
+        self.search_var.trace_add('write', self.on_search_change)
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=(0, 5))
         
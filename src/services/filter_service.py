@@ -2,6 +2,7 @@
 筛选服务 - 提供新闻筛选的高级接口
 """
 import logging
+import threading
 from typing import List, Optional, Dict, Any, Tuple
 from ..models.news import NewsArticle
 from ..config.filter_config import filter_config_manager, AIFilterConfig
@@ -72,7 +73,8 @@ class FilterService:
                        filter_type: str = "chain",
                        callback: Optional[FilterProgressCallback] = None,
                        test_mode: bool = False,
-                       enable_deduplication: Optional[bool] = None) -> FilterChainResult:
+                       enable_deduplication: Optional[bool] = None,
+                       cancel_event: Optional[threading.Event] = None) -> FilterChainResult:
         """
         筛选文章
 
@@ -82,6 +84,7 @@ class FilterService:
             callback: 进度回调函数
             test_mode: 测试模式，使用模拟数据而不调用AI API
             enable_deduplication: 是否启用去重功能，None表示从配置读取
+            cancel_event: 取消信号，置位后逐篇筛选循环尽快停止，返回已处理部分的结果
 
         Returns:
             筛选结果
@@ -131,14 +134,14 @@ class FilterService:
             # 执行筛选
             if filter_type == "keyword":
                 print(f"📝 执行关键词筛选")
-                result = self._keyword_only_filter(articles, callback, test_mode)
+                result = self._keyword_only_filter(articles, callback, test_mode, cancel_event)
             elif filter_type == "ai":
                 print(f"🤖 执行AI筛选")
-                result = self._ai_only_filter(articles, callback, test_mode)
+                result = self._ai_only_filter(articles, callback, test_mode, cancel_event)
             elif filter_type == "chain":
                 print(f"🔗 执行综合筛选 (关键词+AI)")
                 if callback:
-                    result = self.filter_chain.process_with_callback(articles, callback, test_mode)
+                    result = self.filter_chain.process_with_callback(articles, callback, test_mode, cancel_event)
                 else:
                     result = self.filter_chain.process(articles, test_mode)
             else:
@@ -207,7 +210,8 @@ class FilterService:
     
     def _keyword_only_filter(self, articles: List[NewsArticle],
                            callback: Optional[FilterProgressCallback] = None,
-                           test_mode: bool = False) -> FilterChainResult:
+                           test_mode: bool = False,
+                           cancel_event: Optional[threading.Event] = None) -> FilterChainResult:
         """仅关键词筛选"""
         from datetime import datetime
 
@@ -227,6 +231,8 @@ class FilterService:
             batch_size = 10  # 每批处理10篇文章
 
             for i in range(0, len(articles), batch_size):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
                 batch = articles[i:i + batch_size]
                 batch_results = []
 
@@ -280,7 +286,8 @@ class FilterService:
     
     def _ai_only_filter(self, articles: List[NewsArticle],
                       callback: Optional[FilterProgressCallback] = None,
-                      test_mode: bool = False) -> FilterChainResult:
+                      test_mode: bool = False,
+                      cancel_event: Optional[threading.Event] = None) -> FilterChainResult:
         """仅AI筛选"""
         from datetime import datetime
 
@@ -305,6 +312,8 @@ class FilterService:
             total_batches = (len(articles) + batch_size - 1) // batch_size
 
             for batch_num, i in enumerate(range(0, len(articles), batch_size), 1):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
                 batch = articles[i:i + batch_size]
 
                 # 通知批处理开始
@@ -315,6 +324,9 @@ class FilterService:
                 batch_scores = []
 
                 for j, article in enumerate(batch):
+                    # 每篇文章都要调用AI接口，取消后不再发起新的请求
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
                     article_index = i + j + 1
 
                     # 通知开始评估单篇文章
@@ -444,7 +456,8 @@ class FilterService:
     
     def update_config(self, config_type: str, **kwargs):
         """更新筛选配置"""
-        self.config_manager.update_config(config_type, **kwargs)
+        if not self.config_manager.update_config(config_type, **kwargs):
+            return
         
         # 重置筛选器以应用新配置
         if config_type == "keyword":
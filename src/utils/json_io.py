@@ -0,0 +1,100 @@
+"""
+JSON读写工具
+安装了orjson时使用orjson，未安装时使用标准库json，输出格式相同
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# JSON文件解析缓存：绝对路径 -> (修改时间ns, 文件大小, 解析结果)
+_JSON_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+# 配置文件默认以紧凑格式写入；需要手工编辑时设置 NEWS_SELECTOR_PRETTY_JSON=1 输出缩进格式
+PRETTY_CONFIG_JSON = os.getenv("NEWS_SELECTOR_PRETTY_JSON", "0") == "1"
+
+
+def json_loads(data: bytes) -> Any:
+    """解析JSON字节串"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """序列化为中文不转义的UTF-8 JSON字节串
+
+    Args:
+        obj: 要序列化的对象
+        indent: 是否输出两空格缩进格式，否则输出紧凑格式
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def config_json_dumps(obj: Any) -> bytes:
+    """序列化配置文件内容，所有写同一配置文件的地方都应使用此函数，保证文件格式一致"""
+    return json_dumps(obj, indent=PRETTY_CONFIG_JSON)
+
+
+def atomic_write_bytes(path, data: bytes):
+    """先写同目录下的临时文件再替换，避免写入中断留下损坏的文件"""
+    path = os.fspath(path)
+    tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+        raise
+
+
+def load_json_cached(path) -> Any:
+    """读取并解析JSON文件，文件修改时间和大小未变时直接返回缓存（返回值只读，不要修改）
+
+    文件不存在时抛出FileNotFoundError。
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    with _JSON_CACHE_LOCK:
+        cached = _JSON_CACHE.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(key, 'rb') as f:
+        data = json_loads(f.read())
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+def store_json_cache(path, data: Any):
+    """写入文件后用刚写入的内容更新缓存，下次读取无需重新解析"""
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+
+
+def clear_json_cache(path=None):
+    """清空JSON解析缓存；指定path时只清除该文件的缓存"""
+    with _JSON_CACHE_LOCK:
+        if path is None:
+            _JSON_CACHE.clear()
+        else:
+            _JSON_CACHE.pop(os.path.abspath(path), None)
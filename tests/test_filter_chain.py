@@ -0,0 +1,120 @@
+"""
+测试筛选链的取消逻辑
+"""
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.config.filter_config import FilterChainConfig, TagBalanceConfig
+from src.filters.base import AIEvaluation, AIFilterResult, KeywordFilterResult
+from src.filters.filter_chain import FilterChain, FilterProgressCallback
+from src.models.news import NewsArticle
+
+
+def make_articles(count):
+    """生成测试文章"""
+    now = datetime.now()
+    return [
+        NewsArticle(id=f"a{i}", title=f"测试文章{i}", summary="", content="",
+                    url=f"https://example.com/{i}", published=now, updated=now)
+        for i in range(count)
+    ]
+
+
+class StubKeywordFilter:
+    """关键词筛选桩，处理到第cancel_after篇时置位取消事件"""
+
+    def __init__(self, cancel_event, cancel_after=None):
+        self.cancel_event = cancel_event
+        self.cancel_after = cancel_after
+        self.calls = []
+
+    def filter_single(self, article):
+        self.calls.append(article.id)
+        if self.cancel_after is not None and len(self.calls) == self.cancel_after:
+            self.cancel_event.set()
+        return KeywordFilterResult(article=article, matched_keywords=[], relevance_score=0.9,
+                                   category_scores={}, processing_time=0.0)
+
+
+class StubAIFilter:
+    """AI筛选桩，评估到第cancel_after篇时置位取消事件"""
+
+    def __init__(self, cancel_event, cancel_after=None):
+        self.cancel_event = cancel_event
+        self.cancel_after = cancel_after
+        self.config = SimpleNamespace(max_selected=100)
+        self.calls = []
+
+    def filter_single(self, article):
+        self.calls.append(article.id)
+        if self.cancel_after is not None and len(self.calls) == self.cancel_after:
+            self.cancel_event.set()
+        evaluation = AIEvaluation(relevance_score=9, innovation_impact=9, practicality=9,
+                                  total_score=27, reasoning="", confidence=1.0)
+        return AIFilterResult(article=article, evaluation=evaluation,
+                              processing_time=0.0, ai_model="stub")
+
+
+def make_chain(keyword_filter, ai_filter, batch_size=10):
+    """创建关闭标签功能的筛选链"""
+    config = FilterChainConfig(
+        keyword_threshold=0.5,
+        final_score_threshold=0.0,
+        max_final_results=100,
+        batch_size=batch_size,
+        tag_balance=TagBalanceConfig(enable_tag_generation=False, enable_tag_limits=False,
+                                     enable_balanced_selection=False),
+    )
+    return FilterChain(keyword_filter, ai_filter, config)
+
+
+class TestFilterChainCancel:
+    """测试cancel_event中途置位"""
+
+    def test_cancel_during_keyword_stage(self):
+        """关键词阶段取消：处理完当前批次后停止，跳过AI阶段并返回部分结果"""
+        cancel_event = threading.Event()
+        keyword_filter = StubKeywordFilter(cancel_event, cancel_after=3)
+        ai_filter = StubAIFilter(cancel_event)
+        chain = make_chain(keyword_filter, ai_filter, batch_size=5)
+
+        result = chain.process_with_callback(make_articles(20), FilterProgressCallback(),
+                                             cancel_event=cancel_event)
+
+        assert keyword_filter.calls == [f"a{i}" for i in range(5)]
+        assert ai_filter.calls == []
+        assert result.total_articles == 20
+        assert result.keyword_filtered_count == 5
+        assert result.ai_filtered_count == 0
+        assert result.processing_end_time is not None
+
+    def test_cancel_during_ai_stage(self):
+        """AI阶段取消：不再发起新的AI请求，已完成的评估结果保留"""
+        cancel_event = threading.Event()
+        keyword_filter = StubKeywordFilter(cancel_event)
+        ai_filter = StubAIFilter(cancel_event, cancel_after=3)
+        chain = make_chain(keyword_filter, ai_filter)
+
+        result = chain.process_with_callback(make_articles(12), FilterProgressCallback(),
+                                             cancel_event=cancel_event)
+
+        assert len(keyword_filter.calls) == 12
+        assert ai_filter.calls == ["a0", "a1", "a2"]
+        assert result.keyword_filtered_count == 12
+        assert result.ai_filtered_count == 3
+        assert {r.article.id for r in result.selected_articles} == {"a0", "a1", "a2"}
+
+    def test_without_cancel_processes_all(self):
+        """未置位时处理全部文章"""
+        cancel_event = threading.Event()
+        keyword_filter = StubKeywordFilter(cancel_event)
+        ai_filter = StubAIFilter(cancel_event)
+        chain = make_chain(keyword_filter, ai_filter)
+
+        result = chain.process_with_callback(make_articles(7), FilterProgressCallback(),
+                                             cancel_event=cancel_event)
+
+        assert len(keyword_filter.calls) == 7
+        assert len(ai_filter.calls) == 7
+        assert result.ai_filtered_count == 7
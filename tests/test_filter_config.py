@@ -0,0 +1,57 @@
+"""
+测试筛选配置管理器
+"""
+import os
+import tempfile
+
+from src.config.filter_config import FilterConfigManager
+from src.utils.json_io import load_json_cached
+
+
+class TestFilterConfigManager:
+    """测试筛选配置管理器"""
+
+    def test_update_config_unchanged_skips_write(self):
+        """配置未变化时返回False且不写文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = FilterConfigManager(temp_dir)
+            current = manager.configs["ai"].model_name
+
+            assert manager.update_config("ai", model_name=current) is False
+            assert not manager.config_file.exists()
+
+    def test_update_config_unchanged_keeps_existing_file(self):
+        """配置未变化时已有的配置文件保持原样"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = FilterConfigManager(temp_dir)
+            manager.save_configs()
+            before = manager.config_file.read_bytes()
+            manager.config_file.write_bytes(before + b"\n")
+
+            assert manager.update_config("chain", batch_size=manager.configs["chain"].batch_size) is False
+            assert manager.config_file.read_bytes() == before + b"\n"
+
+    def test_update_config_changed_writes(self):
+        """配置变化时返回True并写入文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = FilterConfigManager(temp_dir)
+            new_size = manager.configs["chain"].batch_size + 1
+
+            assert manager.update_config("chain", batch_size=new_size) is True
+            assert manager.config_file.exists()
+            assert FilterConfigManager(temp_dir).configs["chain"].batch_size == new_size
+
+    def test_save_configs_refreshes_parse_cache(self):
+        """保存后不留临时文件，且缓存读取能拿到新内容（即使修改时间和大小不变）"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = FilterConfigManager(temp_dir)
+            manager.save_configs()
+            stat = os.stat(manager.config_file)
+            assert load_json_cached(manager.config_file)["chain"]["sort_by"] == "final_score"
+
+            # 同样长度的新值，并还原修改时间，模拟时间精度不足的文件系统
+            manager.update_config("chain", sort_by="abcdefghijk")
+            os.utime(manager.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            assert os.listdir(temp_dir) == ["filter_config.json"]
+            assert load_json_cached(manager.config_file)["chain"]["sort_by"] == "abcdefghijk"